@@ -0,0 +1,169 @@
+"""Check-in-Regeln der Airlines aus airlines.csv.
+
+Die Datei (Spalten iata;icao;name;stunden;hinweis) wird einmal in einen
+Index geladen: Codes als Dict, Namen als sortierte Liste für die
+Präfixsuche. Ändert sich die Datei, wird sie beim nächsten Zugriff neu
+eingelesen, ohne den Server neu zu starten. Fehlerhafte Zeilen werden
+übersprungen; lässt sich die Datei gar nicht lesen, bleibt der alte Index.
+"""
+import bisect
+import csv
+import difflib
+import logging
+import os
+import threading
+import time
+
+from gazetteer import falte
+
+log = logging.getLogger(__name__)
+
+STANDARD_PFAD = os.environ.get(
+    "CHECKIN_AIRLINES", os.path.join(os.path.dirname(os.path.abspath(__file__)), "airlines.csv")
+)
+
+
+def lese_airlines(pfad):
+    """Liest die Regeldatei; gibt eine Liste von Einträgen (dicts) zurück. Fehlerhafte Zeilen werden übersprungen."""
+    eintraege = []
+    with open(pfad, encoding="utf-8-sig", newline="") as f:
+        leser = csv.DictReader(f, delimiter=";")
+        for zeile in leser:
+            try:
+                stunden = int(zeile["stunden"])
+            except (KeyError, TypeError, ValueError):
+                log.warning("%s, Zeile %d: ungültige Stunden %r, übersprungen",
+                            pfad, leser.line_num, zeile.get("stunden"))
+                continue
+            eintrag = {
+                "iata": (zeile.get("iata") or "").strip().upper(),
+                "icao": (zeile.get("icao") or "").strip().upper(),
+                "name": (zeile.get("name") or "").strip(),
+                "stunden": stunden,
+            }
+            if (zeile.get("hinweis") or "").strip():
+                eintrag["hinweis"] = zeile["hinweis"].strip()
+            eintraege.append(eintrag)
+    return eintraege
+
+
+class AirlineIndex:
+    """Nachschlagen wie beim früheren checkin_fristen-Dict (code in index, index[code])
+    plus Vorschläge über suche()."""
+
+    def __init__(self, pfad=STANDARD_PFAD, pruef_intervall=1.0):
+        self.pfad = pfad
+        self.pruef_intervall = pruef_intervall
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._geprueft = float("-inf")  # erster Aufruf liest immer, unabhängig von monotonic()
+        self._index = ({}, [], [], [])
+        self._aktualisieren()
+
+    def _aktualisieren(self):
+        jetzt = time.monotonic()
+        if jetzt - self._geprueft < self.pruef_intervall:
+            return
+        with self._lock:
+            self._geprueft = jetzt
+            # Fehler beim Lesen (Datei fehlt, wird gerade gespeichert, ...) lassen den alten Index stehen
+            try:
+                mtime = os.stat(self.pfad).st_mtime_ns
+                if mtime == self._mtime:
+                    return
+                eintraege = lese_airlines(self.pfad)
+            except (OSError, UnicodeDecodeError, csv.Error) as e:
+                log.warning("%s konnte nicht gelesen werden, bisherige Regeln bleiben: %s", self.pfad, e)
+                return
+            if not eintraege and self._mtime is not None:
+                log.warning("%s enthält keine gültigen Regeln, bisherige Regeln bleiben", self.pfad)
+                return
+            codes = {e["icao"]: e for e in eintraege if e["icao"]}
+            codes.update({e["iata"]: e for e in eintraege if e["iata"]})  # IATA hat Vorrang
+            namen = []
+            for e in eintraege:
+                woerter = falte(e["name"]).split()
+                # jedes Wort ist ein Einstieg, damit "express" auch SunExpress findet
+                namen.extend((" ".join(woerter[i:]), e["name"], e) for i in range(len(woerter)))
+            namen.sort(key=lambda n: (n[0], n[1]))
+            # als ein Tupel tauschen, damit Leser nie halb alte, halb neue Daten sehen
+            self._index = (codes, sorted(codes), [n[0] for n in namen], [n[2] for n in namen])
+            self._mtime = mtime
+
+    def __contains__(self, code):
+        self._aktualisieren()
+        return code in self._index[0]
+
+    def __getitem__(self, code):
+        self._aktualisieren()
+        return self._index[0][code]
+
+    def get(self, code, default=None):
+        self._aktualisieren()
+        return self._index[0].get(code, default)
+
+    def __len__(self):
+        self._aktualisieren()
+        return len({id(e) for e in self._index[0].values()})
+
+    def finde(self, text):
+        """Die eine Airline zu einem Code oder Namen ("LH", "Condor", "sunexp"), sonst None.
+
+        Ein Namenspräfix zählt erst ab drei Zeichen und nur, wenn es eindeutig ist.
+        """
+        self._aktualisieren()
+        codes, _, schluessel, eintraege = self._index
+        code = text.strip().upper()
+        if code in codes:
+            return codes[code]
+        key = falte(text)
+        if len(key) < 3:
+            return None
+        # exakte Schlüssel stehen am Anfang des Präfixbereichs
+        anfang = i = bisect.bisect_left(schluessel, key)
+        genau = []
+        while i < len(schluessel) and schluessel[i] == key:
+            if falte(eintraege[i]["name"]) == key and eintraege[i] not in genau:
+                genau.append(eintraege[i])
+            i += 1
+        if len(genau) == 1:
+            return genau[0]
+        treffer = {}
+        i = anfang
+        while i < len(schluessel) and schluessel[i].startswith(key) and len(treffer) < 2:
+            treffer[id(eintraege[i])] = eintraege[i]
+            i += 1
+        return next(iter(treffer.values())) if len(treffer) == 1 else None
+
+    def suche(self, text, limit=8):
+        """Vorschläge für eine Eingabe: exakter Code, Code-/Namenspräfix, dann unscharfe Namenstreffer."""
+        self._aktualisieren()
+        codes, code_liste, schluessel, eintraege = self._index
+        ergebnis = []
+
+        def dazu(eintrag):
+            if eintrag not in ergebnis:
+                ergebnis.append(eintrag)
+
+        code = text.strip().upper()
+        if code in codes:
+            dazu(codes[code])
+        key = falte(text)
+        if not key:
+            return ergebnis
+        i = bisect.bisect_left(schluessel, key)
+        while i < len(schluessel) and schluessel[i].startswith(key) and len(ergebnis) < limit:
+            dazu(eintraege[i])
+            i += 1
+        if len(ergebnis) < limit and len(code) <= 3:
+            i = bisect.bisect_left(code_liste, code)
+            while i < len(code_liste) and code_liste[i].startswith(code) and len(ergebnis) < limit:
+                dazu(codes[code_liste[i]])
+                i += 1
+        if len(ergebnis) < limit and len(key) >= 3:
+            # unscharf nur unter Schlüsseln mit denselben zwei Anfangsbuchstaben, sonst wird
+            # difflib bei tausenden Airlines pro Tastendruck zu langsam
+            anfang, ende = bisect.bisect_left(schluessel, key[:2]), bisect.bisect_left(schluessel, key[:2] + "\uffff")
+            for treffer in difflib.get_close_matches(key, schluessel[anfang:ende], n=limit, cutoff=0.6):
+                dazu(eintraege[bisect.bisect_left(schluessel, treffer)])
+        return ergebnis[:limit]
@@ -0,0 +1,213 @@
+"""JSON-HTTP-Schnittstelle für die Check-in-Berechnung, ohne Streamlit.
+
+    python api.py --port 8080
+
+POST /checkin mit einem Flug oder einer Liste von Flügen:
+
+    {"airline": "XQ", "abflugort": "Antalya", "abflug": "2405 1925"}
+
+Optional "stunden", um die Frist der Airline zu überschreiben. Antwort je Flug:
+abflug_lokal, zeitzone, checkin_de (ISO 8601, Europe/Berlin) und hinweis,
+oder "fehler".
+
+Abflugorte gehen erst an den Gazetteer, dann asynchron an Nominatim über eine
+gemeinsame Keep-alive-Verbindung. Gleichzeitige Anfragen für denselben Ort
+teilen sich eine Nominatim-Abfrage; Ergebnisse bleiben im Speicher.
+"""
+import argparse
+import asyncio
+import math
+import os
+import time
+from collections import OrderedDict
+
+import aiohttp
+from aiohttp import web
+
+from airlines import AirlineIndex
+from gazetteer import STANDARD_PFAD, Gazetteer, Ort, falte
+from rechner import OrtNichtGefunden, ZeitzoneUnbekannt, checkin_zeit, parse_abflug
+from zeitzonen import resolver
+import metriken
+
+NOMINATIM_URL = os.environ.get("CHECKIN_NOMINATIM_URL", "https://nominatim.openstreetmap.org")
+NOMINATIM_INTERVALL = float(os.environ.get("CHECKIN_NOMINATIM_INTERVALL", "1.0"))
+MAX_STUNDEN = 336  # wie im Eingabefeld der App
+
+SESSION = web.AppKey("session", aiohttp.ClientSession)
+GEOCODER = web.AppKey("geocoder", object)
+AIRLINES = web.AppKey("airlines", AirlineIndex)
+
+
+class AsyncGeocoder:
+    """Gazetteer, sonst Nominatim per aiohttp; doppelte Anfragen werden zusammengelegt."""
+
+    def __init__(self, session, gazetteer=None, url=NOMINATIM_URL, min_intervall=NOMINATIM_INTERVALL,
+                 max_eintraege=10_000):
+        self.session = session
+        self.gazetteer = gazetteer
+        self.url = url.rstrip("/") + "/search"
+        self.min_intervall = min_intervall
+        self.max_eintraege = max_eintraege
+        self.anfragen = 0
+        self._cache = OrderedDict()
+        self._laufend = {}
+        self._naechster_start = 0.0
+
+    async def geocode(self, text):
+        if self.gazetteer is not None:
+            ort = self.gazetteer.suche(text)
+            if ort:
+                return ort
+        key = falte(text)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        laufend = self._laufend.get(key)
+        if laufend is None:
+            laufend = self._laufend[key] = asyncio.ensure_future(self._nominatim(text, key))
+            laufend.add_done_callback(lambda _: self._laufend.pop(key, None))
+        return await asyncio.shield(laufend)
+
+    async def _nominatim(self, text, key):
+        # Startzeitpunkte wie beim synchronen Geocoder reservieren (höchstens eine Anfrage pro Intervall)
+        jetzt = time.monotonic()
+        start = max(jetzt, self._naechster_start)
+        self._naechster_start = start + self.min_intervall
+        if start > jetzt:
+            await asyncio.sleep(start - jetzt)
+        self.anfragen += 1
+        try:
+            with metriken.messen("nominatim"):
+                async with self.session.get(self.url, params={"q": text, "format": "json", "limit": "1"}) as antwort:
+                    antwort.raise_for_status()
+                    treffer = await antwort.json(content_type=None)
+        except asyncio.TimeoutError:
+            metriken.zaehle("geocoder_timeout")
+            raise
+        except aiohttp.ClientError:
+            metriken.zaehle("geocoder_fehler")
+            raise
+        ort = None
+        if treffer:
+            ort = Ort(treffer[0].get("display_name", text), "", float(treffer[0]["lat"]),
+                      float(treffer[0]["lon"]), None)
+        self._cache[key] = ort
+        if len(self._cache) > self.max_eintraege:
+            self._cache.popitem(last=False)
+        return ort
+
+
+async def zeitzone(abflugort, geocoder):
+    with metriken.messen("geocode"):
+        location = await geocoder.geocode(abflugort)
+    if not location:
+        raise OrtNichtGefunden(abflugort)
+    tz_name = location.zeitzone
+    if not tz_name:
+        with metriken.messen("timezone_at"):
+            tz_name = resolver().timezone_at(location.latitude, location.longitude)
+    if not tz_name:
+        raise ZeitzoneUnbekannt(abflugort)
+    return tz_name
+
+
+def _text(wert):
+    """JSON-Wert als getrimmter Text; null wird zu ""."""
+    return "" if wert is None else str(wert).strip()
+
+
+def berechne(flug, zonen, airlines):
+    """Ein Flug -> Antwort-Dict; zonen bildet Abflugort -> Zeitzonenname oder Exception ab."""
+    code = _text(flug.get("airline")).upper()
+    abflugort = _text(flug.get("abflugort"))
+    antwort = {"airline": code, "abflugort": abflugort}
+    regel = airlines.get(code)
+    stunden = flug.get("stunden")
+    if stunden is None and regel:
+        stunden = regel["stunden"]
+    if stunden is None:
+        return {**antwort, "fehler": "Airline nicht erkannt – bitte stunden angeben"}
+    try:
+        stunden = float(stunden)
+    except (TypeError, ValueError):
+        return {**antwort, "fehler": "stunden muss eine Zahl sein"}
+    if not math.isfinite(stunden) or not 0 <= stunden <= MAX_STUNDEN:
+        return {**antwort, "fehler": f"stunden muss zwischen 0 und {MAX_STUNDEN} liegen"}
+    try:
+        abflug_dt = parse_abflug(_text(flug.get("abflug")))
+    except ValueError:
+        return {**antwort, "fehler": "Ungültiges Datumsformat, erwartet TTMM HHMM"}
+    tz_name = zonen.get(abflugort)
+    if isinstance(tz_name, OrtNichtGefunden) or not abflugort:
+        return {**antwort, "fehler": "Ort konnte nicht gefunden werden"}
+    if isinstance(tz_name, ZeitzoneUnbekannt):
+        return {**antwort, "fehler": "Zeitzone konnte nicht bestimmt werden"}
+    if isinstance(tz_name, Exception):
+        return {**antwort, "fehler": "Geocoder nicht erreichbar"}
+    ergebnis = checkin_zeit(abflug_dt, tz_name, stunden, resolver())
+    antwort.update(
+        abflug_lokal=ergebnis.abflug_lokal.isoformat(),
+        zeitzone=ergebnis.zeitzone,
+        checkin_de=ergebnis.checkin_de.isoformat(),
+        stunden=stunden,
+    )
+    if regel and "hinweis" in regel:
+        antwort["hinweis"] = regel["hinweis"]
+    return antwort
+
+
+async def checkin(request):
+    try:
+        daten = await request.json()
+    except ValueError:
+        raise web.HTTPBadRequest(text="JSON erwartet")
+    einzeln = isinstance(daten, dict)
+    fluege = [daten] if einzeln else daten
+    if not isinstance(fluege, list) or not all(isinstance(f, dict) for f in fluege):
+        raise web.HTTPBadRequest(text="Ein Flug-Objekt oder eine Liste von Flug-Objekten erwartet")
+
+    orte = {_text(f.get("abflugort")) for f in fluege} - {""}
+    geocoder = request.app[GEOCODER]
+    ergebnisse = await asyncio.gather(*(zeitzone(o, geocoder) for o in orte), return_exceptions=True)
+    zonen = dict(zip(orte, ergebnisse))
+    antworten = [berechne(f, zonen, request.app[AIRLINES]) for f in fluege]
+    return web.json_response(antworten[0] if einzeln else antworten)
+
+
+async def gesundheit(request):
+    return web.json_response({"status": "ok"})
+
+
+async def _start(app):
+    app[SESSION] = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+        timeout=aiohttp.ClientTimeout(total=10),
+        headers={"User-Agent": "checkin_app"},
+    )
+    gazetteer = Gazetteer(STANDARD_PFAD) if os.path.exists(STANDARD_PFAD) else None
+    app[GEOCODER] = AsyncGeocoder(app[SESSION], gazetteer)
+    app[AIRLINES] = AirlineIndex()
+    resolver().timezone_at(52.52, 13.405)  # TimezoneFinder einmal laden, bevor die erste Anfrage kommt
+
+
+async def _stopp(app):
+    await app[SESSION].close()
+
+
+def erstelle_app():
+    app = web.Application()
+    app.router.add_post("/checkin", checkin)
+    app.router.add_get("/health", gesundheit)
+    app.on_startup.append(_start)
+    app.on_cleanup.append(_stopp)
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP-API für die Check-in-Berechnung")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    metriken.starte_export()
+    web.run_app(erstelle_app(), host=args.host, port=args.port, access_log=None)
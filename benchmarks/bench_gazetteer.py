@@ -0,0 +1,68 @@
+"""Vergleicht Latenz und Trefferquote der Abflugort-Suche: Gazetteer gegen Nominatim.
+
+    python benchmarks/bench_gazetteer.py orte.sqlite            # nur Gazetteer
+    python benchmarks/bench_gazetteer.py orte.sqlite --nominatim  # zusätzlich live (1 Anfrage/s)
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gazetteer import Gazetteer  # noqa: E402
+
+# Abflugorte, wie sie tatsächlich im Feld eingegeben werden
+ABFLUGORTE = [
+    "Antalya", "Palma de Mallorca", "Palma", "San José, Costa Rica", "San Jose", "Hurghada",
+    "Izmir", "Dalaman", "Bodrum", "Heraklion", "Rhodos", "Kos", "Korfu", "Teneriffa",
+    "Las Palmas", "Fuerteventura", "Lanzarote", "Faro", "Lissabon", "Málaga", "Malaga",
+    "Barcelona", "Punta Cana", "Cancún", "Cancun", "Havanna", "Bangkok", "Phuket",
+    "Dubai", "Marsa Alam", "Sharm el Sheikh", "Djerba", "Agadir", "Marrakesch",
+    "Muenchen", "München", "Düsseldorf", "Duesseldorf", "Köln", "Frankfurt am Main",
+    "Hamburg", "Berlin", "Zürich", "Wien", "Pristina", "Istanbul", "Ankara", "Kayseri",
+    "Gaziantep", "Erbil", "New York", "Miami", "Windhoek", "Kapstadt", "Mauritius",
+    "Malediven", "Türkei", "Costa Rica",
+]
+
+
+def messe(funktion, orte, pause=0.0):
+    zeiten, treffer = [], 0
+    for ort in orte:
+        start = time.perf_counter()
+        ergebnis = funktion(ort)
+        zeiten.append(time.perf_counter() - start)
+        treffer += ergebnis is not None
+        if pause:
+            time.sleep(pause)
+    zeiten.sort()
+    return {
+        "median_ms": statistics.median(zeiten) * 1000,
+        "p99_ms": zeiten[min(len(zeiten) - 1, int(len(zeiten) * 0.99))] * 1000,
+        "trefferquote": treffer / len(orte),
+    }
+
+
+def ausgabe(name, werte):
+    print(f"{name:<12} median {werte['median_ms']:9.3f} ms   p99 {werte['p99_ms']:9.3f} ms   "
+          f"Treffer {werte['trefferquote']:.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("datenbank")
+    parser.add_argument("--nominatim", action="store_true", help="auch live gegen Nominatim messen")
+    parser.add_argument("--wiederholungen", type=int, default=100)
+    args = parser.parse_args()
+
+    gaz = Gazetteer(args.datenbank)
+    messe(gaz.suche, ABFLUGORTE)  # Aufwärmen (Verbindung, Seitencache)
+    ausgabe("Gazetteer", messe(gaz.suche, ABFLUGORTE * args.wiederholungen))
+    fehlt = [o for o in ABFLUGORTE if gaz.suche(o) is None]
+    if fehlt:
+        print("  nicht gefunden:", ", ".join(fehlt))
+
+    if args.nominatim:
+        from geopy.geocoders import Nominatim
+        nominatim = Nominatim(user_agent="checkin_app")
+        ausgabe("Nominatim", messe(nominatim.geocode, ABFLUGORTE, pause=1.0))
@@ -0,0 +1,174 @@
+"""Latenz- und Durchsatzmessung für den Rechenkern mit Budgets.
+
+    python benchmarks/bench_rechner.py              # alle Messungen
+    python benchmarks/bench_rechner.py --zeilen 10000
+
+Geocoder und Zeitzonen-Resolver sind offline ersetzt bzw. vorgewärmt, gemessen
+wird nur der eigene Code. Liegt eine Messung über ihrem Budget, endet das Skript
+mit Exit-Code 1, damit Regressionen im CI auffallen.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pandas as pd  # noqa: E402
+
+from airlines import AirlineIndex  # noqa: E402
+from gazetteer import Ort  # noqa: E402
+from rechner import (berechne_checkin, datumsdifferenz, parse_abflug, parse_geburtsdatum,  # noqa: E402
+                     visum_ablauf)
+from passagierliste import berechne_passagiere  # noqa: E402
+from sammelberechnung import berechne_block  # noqa: E402
+from zeitzonen import ZeitzonenResolver  # noqa: E402
+
+# Budgets: Median pro Aufruf in µs und Gesamtzeit für --zeilen Aufrufe/Zeilen in s
+BUDGET_AUFRUF_US = {
+    "parse_abflug": 40,
+    "berechne_checkin": 80,
+    "timezone_at (warm)": 15,
+    "parse_geburtsdatum": 30,
+    "visum_ablauf": 30,
+    "datumsdifferenz": 50,
+    "airlines.finde": 30,
+    "airlines.suche (Präfix)": 200,
+    "airlines.suche (unscharf)": 3000,
+}
+BUDGET_ZEILEN_S = {
+    "parse_abflug": 4.0,
+    "berechne_checkin": 8.0,
+    "timezone_at (warm)": 1.5,
+    "parse_geburtsdatum": 3.0,
+    "visum_ablauf": 3.0,
+    "datumsdifferenz": 5.0,
+    "Sammelberechnung (Block)": 3.0,
+    "Passagierliste": 1.5,
+}
+
+
+class StubGeocoder:
+    def __init__(self):
+        self.orte = {
+            "Antalya": Ort("Antalya", "TR", 36.91, 30.70, "Europe/Istanbul"),
+            "San José, Costa Rica": Ort("San José", "CR", 9.93, -84.08, None),
+        }
+
+    def geocode(self, text):
+        return self.orte.get(text)
+
+
+def airline_datei(verzeichnis, anzahl=3000):
+    """Regeldatei mit anzahl erfundenen Airlines plus den echten aus airlines.csv."""
+    zufall = random.Random(1)
+    silben = ["air", "sun", "jet", "sky", "euro", "wing", "star", "blue", "nord", "trans", "ex", "press",
+              "con", "dor", "lynx", "fly", "way", "line", "tour", "aero", "al", "ka", "mi", "ro", "ta", "vi"]
+    pfad = os.path.join(verzeichnis, "airlines.csv")
+    with open(pfad, "w", encoding="utf-8") as f:
+        with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "airlines.csv"),
+                  encoding="utf-8-sig") as echt:
+            f.write(echt.read())
+        for i in range(anzahl):
+            name = " ".join("".join(zufall.choice(silben) for _ in range(zufall.randint(2, 3))).capitalize()
+                            for _ in range(zufall.randint(1, 2)))
+            f.write(f"{i:04d};Q{i:04d};{name};24;\n")
+    return pfad
+
+
+def median_us(funktion, wiederholungen=2000):
+    zeiten = []
+    for _ in range(wiederholungen):
+        start = time.perf_counter()
+        funktion()
+        zeiten.append(time.perf_counter() - start)
+    zeiten.sort()
+    return zeiten[len(zeiten) // 2] * 1e6
+
+
+def gesamt_s(funktion, zeilen):
+    start = time.perf_counter()
+    for _ in range(zeilen):
+        funktion()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--zeilen", type=int, default=100_000)
+    args = parser.parse_args()
+
+    geocoder, resolver = StubGeocoder(), ZeitzonenResolver()
+    resolver.timezone_at(9.93, -84.08)  # TimezoneFinder laden und Koordinate vorwärmen
+    abflug = datetime(2026, 5, 24, 19, 25)
+    heute = date(2026, 10, 18)
+    aufrufe = {
+        "parse_abflug": lambda: parse_abflug("2405 1925", 2026),
+        "berechne_checkin": lambda: berechne_checkin("San José, Costa Rica", abflug, 30, geocoder, resolver),
+        "timezone_at (warm)": lambda: resolver.timezone_at(9.93, -84.08),
+        "parse_geburtsdatum": lambda: parse_geburtsdatum("24051990", heute),
+        "visum_ablauf": lambda: visum_ablauf("01102026", 30),
+        "datumsdifferenz": lambda: datumsdifferenz("01102026", "24122026"),
+    }
+
+    ueberschritten = []
+
+    def pruefe(name, wert, budget, einheit):
+        status = "ok" if wert <= budget else "ÜBER BUDGET"
+        print(f"{name:<28} {wert:10.2f} {einheit:<3} (Budget {budget:g} {einheit})  {status}")
+        if wert > budget:
+            ueberschritten.append(name)
+
+    print("Median pro Aufruf")
+    for name, funktion in aufrufe.items():
+        pruefe(name, median_us(funktion), BUDGET_AUFRUF_US[name], "µs")
+
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        airlines = AirlineIndex(airline_datei(verzeichnis), pruef_intervall=3600)
+        # je Tastendruck: Code/Name auflösen, Präfixvorschläge, Tippfehler über unscharfe Suche
+        airline_aufrufe = {
+            "airlines.finde": lambda: airlines.finde("Condor"),
+            "airlines.suche (Präfix)": lambda: airlines.suche("sun"),
+            "airlines.suche (unscharf)": lambda: airlines.suche("sunexprss"),
+        }
+        for name, funktion in airline_aufrufe.items():
+            pruefe(name, median_us(funktion, 200), BUDGET_AUFRUF_US[name], "µs")
+
+    print(f"\n{args.zeilen} Aufrufe bzw. Zeilen")
+    faktor = args.zeilen / 100_000
+    for name, funktion in aufrufe.items():
+        pruefe(name, gesamt_s(funktion, args.zeilen), BUDGET_ZEILEN_S[name] * faktor, "s")
+
+    orte = ["Antalya", "San José, Costa Rica", "Nirgendwo"]
+    block = pd.DataFrame({
+        "airline": ["LH", "XQ", "ZZ", "DE"] * (args.zeilen // 4),
+        "abflugort": (orte * args.zeilen)[:args.zeilen // 4 * 4],
+        "abflug": ["2405 1925", "3110 0230", "0101 0000", "9999 9999"] * (args.zeilen // 4),
+    })
+    zonen = {"Antalya": "Europe/Istanbul", "San José, Costa Rica": "America/Costa_Rica", "Nirgendwo": None}
+    fristen = {"LH": {"stunden": 30}, "XQ": {"stunden": 72, "hinweis": "Reisepass erforderlich"}, "DE": {"stunden": 24}}
+    start = time.perf_counter()
+    berechne_block(block, zonen, fristen, jahr=2026)
+    pruefe("Sammelberechnung (Block)", time.perf_counter() - start, BUDGET_ZEILEN_S["Sammelberechnung (Block)"] * faktor, "s")
+
+    passagiere = pd.DataFrame({
+        "geburtsdatum": ["24051990", "29022012", "31021990", ""] * (args.zeilen // 4),
+        "reisedatum": ["01062026", "28022026", "", "01062026"] * (args.zeilen // 4),
+        "rueckreise": ["15062026", "xx", "", "01062026"] * (args.zeilen // 4),
+        "visum_ab": ["01052026", "", "01052026", "3105202"] * (args.zeilen // 4),
+        "visum_tage": ["30", "", "400", "90"] * (args.zeilen // 4),
+    })
+    start = time.perf_counter()
+    berechne_passagiere(passagiere, heute)
+    pruefe("Passagierliste", time.perf_counter() - start, BUDGET_ZEILEN_S["Passagierliste"] * faktor, "s")
+
+    if ueberschritten:
+        print("\nBudget überschritten:", ", ".join(ueberschritten))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
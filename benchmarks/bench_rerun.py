@@ -0,0 +1,132 @@
+"""Misst Serverzeit und übertragene Bytes pro Interaktion in der laufenden App.
+
+Startet `streamlit run` für die angegebene App-Datei, verbindet sich wie ein
+Browser über den Websocket und tippt wiederholt ein Geburtsdatum ein. Gemessen
+werden die Skriptlaufzeit auf dem Server (aus dem Seitenprofil), die Antwortzeit
+bis script_finished und die Größe aller Nachrichten an den Browser.
+
+    python benchmarks/bench_rerun.py                      # aktuelle App
+    git show <alter-commit>:checkin_app.py > alt_app.py   # Vergleich mit einem älteren Stand
+    python benchmarks/bench_rerun.py alt_app.py
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+WURZEL = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LABEL = "Geburtsdatum (TTMMJJJJ)"
+
+
+def freier_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def starte_server(app, port):
+    prozess = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", app, "--server.headless", "true",
+         "--server.port", str(port), "--server.enableXsrfProtection", "false",
+         # gatherUsageStats schaltet das Seitenprofil mit der Skriptlaufzeit ein
+         "--browser.gatherUsageStats", "true"],
+        cwd=WURZEL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    for _ in range(200):
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return prozess
+        except OSError:
+            time.sleep(0.1)
+    prozess.kill()
+    raise RuntimeError("Streamlit-Server startet nicht")
+
+
+async def lauf(ws, widget_states=None, fragment_id=""):
+    """Schickt einen Rerun und liest bis script_finished.
+
+    Gibt (Antwortzeit s, Skriptlaufzeit s, Bytes, Nachrichten) zurück; das Seitenprofil selbst zählt
+    nicht zu den Bytes, weil es nur für die Messung eingeschaltet ist.
+    """
+    msg = BackMsg()
+    msg.rerun_script.SetInParent()
+    if widget_states:
+        msg.rerun_script.widget_states.widgets.extend(widget_states)
+    if fragment_id:
+        msg.rerun_script.fragment_id = fragment_id
+    start = time.perf_counter()
+    await ws.send(msg.SerializeToString())
+    nachrichten, groesse, skriptzeit = [], 0, None
+    while True:
+        daten = await ws.recv()
+        fwd = ForwardMsg()
+        fwd.ParseFromString(daten)
+        nachrichten.append(fwd)
+        if fwd.WhichOneof("type") == "page_profile":
+            skriptzeit = fwd.page_profile.exec_time / 1e6
+        else:
+            groesse += len(daten)
+        if fwd.WhichOneof("type") == "script_finished":
+            return time.perf_counter() - start, skriptzeit, groesse, nachrichten
+
+
+def finde_widget(nachrichten, label):
+    for fwd in nachrichten:
+        if fwd.WhichOneof("type") != "delta" or fwd.delta.WhichOneof("type") != "new_element":
+            continue
+        element = fwd.delta.new_element
+        if element.WhichOneof("type") == "text_input" and element.text_input.label == label:
+            return element.text_input.id, fwd.delta.fragment_id
+    raise RuntimeError(f"Eingabefeld {label!r} nicht gefunden")
+
+
+async def messen(port, wiederholungen):
+    async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"],
+                                  max_size=None) as ws:
+        _, _, erste_bytes, nachrichten = await lauf(ws)
+        widget_id, fragment_id = finde_widget(nachrichten, LABEL)
+        zeiten, skriptzeiten, groessen = [], [], []
+        for i in range(wiederholungen):
+            zustand = BackMsg().rerun_script.widget_states.widgets.add()
+            zustand.id = widget_id
+            zustand.string_value = f"{1 + i % 28:02d}011990"
+            dauer, skriptzeit, groesse, _ = await lauf(ws, [zustand], fragment_id)
+            zeiten.append(dauer)
+            skriptzeiten.append(skriptzeit)
+            groessen.append(groesse)
+        return erste_bytes, bool(fragment_id), zeiten, skriptzeiten, groessen
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("app", nargs="?", default="checkin_app.py")
+    parser.add_argument("--wiederholungen", type=int, default=50)
+    args = parser.parse_args()
+
+    port = freier_port()
+    prozess = starte_server(args.app, port)
+    try:
+        erste_bytes, fragment, zeiten, skriptzeiten, groessen = asyncio.run(messen(port, args.wiederholungen))
+    finally:
+        prozess.terminate()
+        prozess.wait()
+    print(f"App: {args.app}")
+    print(f"Erster Seitenaufbau:          {erste_bytes:8d} Bytes")
+    print(f"Rerun pro Eingabe:            {'nur Abschnitt (Fragment)' if fragment else 'ganze Seite'}")
+    if None not in skriptzeiten:
+        print(f"Skriptlaufzeit pro Eingabe:   {statistics.median(skriptzeiten) * 1000:8.2f} ms (Median)")
+    print(f"Antwortzeit pro Eingabe:      {statistics.median(zeiten) * 1000:8.2f} ms (Median)")
+    print(f"Übertragen pro Eingabe:       {int(statistics.median(groessen)):8d} Bytes (Median)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Lasttest für api.py gegen einen lokalen Nominatim-Stub.
+
+    python benchmarks/lasttest_api.py --anfragen 5000 --parallel 64
+
+Startet einen Stub-Geocoder (antwortet mit fester Verzögerung), dann api.py als
+eigenen Prozess, der auf den Stub zeigt, und schickt Einzelanfragen mit
+wechselnden Abflugorten. Ausgegeben werden Durchsatz, Latenzen und wie oft der
+Stub tatsächlich gefragt wurde (zeigt Cache und Zusammenlegen gleicher Orte).
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import aiohttp
+from aiohttp import web
+
+WURZEL = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Koordinaten für den Stub (lat, lon)
+ORTE = {
+    "Antalya": (36.8969, 30.7133), "Palma de Mallorca": (39.5696, 2.6502), "Hurghada": (27.2579, 33.8116),
+    "Izmir": (38.4237, 27.1428), "Heraklion": (35.3387, 25.1442), "Faro": (37.0194, -7.9304),
+    "Punta Cana": (18.5601, -68.3725), "San José, Costa Rica": (9.9281, -84.0907), "Bangkok": (13.7563, 100.5018),
+    "Dubai": (25.2048, 55.2708), "Windhoek": (-22.5609, 17.0658), "New York": (40.7128, -74.0060),
+}
+AIRLINES = ["LH", "XQ", "DE", "X3", "EW", "SR"]
+
+
+def freier_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def starte_stub(port, verzoegerung):
+    zaehler = {"anfragen": 0}
+
+    async def suche(request):
+        zaehler["anfragen"] += 1
+        await asyncio.sleep(verzoegerung)
+        ort = ORTE.get(request.query.get("q", ""))
+        if not ort:
+            return web.json_response([])
+        return web.json_response([{"lat": str(ort[0]), "lon": str(ort[1]), "display_name": request.query["q"]}])
+
+    app = web.Application()
+    app.router.add_get("/search", suche)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner, zaehler
+
+
+async def warte_auf(url, sekunden=30):
+    async with aiohttp.ClientSession() as session:
+        ende = time.monotonic() + sekunden
+        while time.monotonic() < ende:
+            try:
+                async with session.get(url) as antwort:
+                    if antwort.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"{url} antwortet nicht")
+
+
+async def last(url, anfragen, parallel):
+    latenzen, fehler = [], 0
+    zufall = random.Random(1)
+    orte = list(ORTE)
+    queue = asyncio.Queue()
+    for _ in range(anfragen):
+        queue.put_nowait({"airline": zufall.choice(AIRLINES), "abflugort": zufall.choice(orte),
+                          "abflug": f"{zufall.randint(1, 28):02d}{zufall.randint(1, 12):02d} 1925"})
+
+    async def arbeiter(session):
+        nonlocal fehler
+        while not queue.empty():
+            flug = queue.get_nowait()
+            start = time.perf_counter()
+            async with session.post(url, json=flug) as antwort:
+                daten = await antwort.json()
+            latenzen.append(time.perf_counter() - start)
+            if antwort.status != 200 or "fehler" in daten:
+                fehler += 1
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=parallel)) as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(arbeiter(session) for _ in range(parallel)))
+        dauer = time.perf_counter() - start
+    return dauer, sorted(latenzen), fehler
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--anfragen", type=int, default=5000)
+    parser.add_argument("--parallel", type=int, default=64)
+    parser.add_argument("--stub-verzoegerung", type=float, default=0.05, help="Antwortzeit des Stubs in s")
+    args = parser.parse_args()
+
+    stub_port, api_port = freier_port(), freier_port()
+    runner, zaehler = await starte_stub(stub_port, args.stub_verzoegerung)
+    env = dict(os.environ, CHECKIN_NOMINATIM_URL=f"http://127.0.0.1:{stub_port}", CHECKIN_NOMINATIM_INTERVALL="0",
+               CHECKIN_GAZETTEER=os.path.join(WURZEL, "gibt-es-nicht.sqlite"))
+    api = subprocess.Popen([sys.executable, "api.py", "--port", str(api_port)], cwd=WURZEL, env=env)
+    try:
+        await warte_auf(f"http://127.0.0.1:{api_port}/health")
+        dauer, latenzen, fehler = await last(f"http://127.0.0.1:{api_port}/checkin", args.anfragen, args.parallel)
+    finally:
+        api.terminate()
+        api.wait()
+        await runner.cleanup()
+
+    print(f"{args.anfragen} Anfragen, {args.parallel} parallel, Stub-Verzögerung {args.stub_verzoegerung * 1000:.0f} ms")
+    print(f"Durchsatz:       {args.anfragen / dauer:8.0f} Anfragen/s")
+    print(f"Latenz p50:      {statistics.median(latenzen) * 1000:8.2f} ms")
+    print(f"Latenz p99:      {latenzen[int(len(latenzen) * 0.99) - 1] * 1000:8.2f} ms")
+    print(f"Fehler:          {fehler:8d}")
+    print(f"Stub-Anfragen:   {zaehler['anfragen']:8d} (für {len(ORTE)} verschiedene Orte)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
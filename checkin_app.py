@@ -1,118 +1,226 @@
 
 import streamlit as st
 st.set_page_config(page_title="Check-in & Visumrechner", page_icon="🧾")
-from datetime import datetime, timedelta, date
-from timezonefinder import TimezoneFinder
-from geopy.geocoders import Nominatim
-import pytz
 from PIL import Image
+from geopy.exc import GeocoderServiceError
+from gazetteer import lade_geocoder
+from airlines import AirlineIndex
+from zeitzonen import resolver
+from rechner import (OrtNichtGefunden, ZeitzoneUnbekannt, checkin_zeit, datumsdifferenz, parse_abflug,
+                     parse_geburtsdatum, visum_ablauf)
+import pandas as pd
+from sammelberechnung import lese_buchungen, berechne_liste
+from passagierliste import lese_passagiere, berechne_passagiere
+from vorabsuche import Vorabsuche
+import metriken
 
-# Logo wie in Ergo-App (oben links, nicht zentriert)
-st.markdown("""
-<img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAfQAAAEuCAQAAADSeihIAAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAAAmJLR0QA/4ePzL8AAAAHdElNRQfjCBYAIin8Bl5CAABNQElEQVR42u2dd3wUZd7Av89uKmlAEkKv0ntXahpIkQ4WEBti7+fpnXq2U88r3p2eZxflUEGK9JrsZinSq/QeUEpIKAECaTvP+8dudmd3ZzdLDfo+33zE2ZlnZp4pv3me59ceUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUil8joqIroFBcS9aEn08QCSTJBBJIJJFowkRVmUAMUYRRuXwJEIXyIuc4KXLkaXGOU/IYh0S2djQtT8iKvrrgUYKu+M1gq1rawFRDVhd1ZE2qkSASZBJx1+x0xexhP3vlLnZEbOtxrqKvPjBK0BW/WjJqmpvJhqKOrEM16lGPmAqrip2dYj0rWZay58Zs55WgK341zA2Nqq81Ei1pQD0aUp9KFV0jA05iEYvkgrSciq6IJ0rQFTc0mVVMrWRTWtJUNJCNCK3o+gSJnaXy4fR9FV0NN0rQFTccGfVNLUUr2YJm1KfaFR/uJHmcJV9eFIWcoYiT4qLUnL8RFyn0LC6rAFCFMBElo0Uk8bIysSQSTwJhl3Dej9Ier+g76UYJuuKGILOKaEsz0ZyWsj1VL+MARRwnh1yRK0+QK3LJJZcT2lnzuZTSq1rLOqZ6WgPq0YCGNCEyQOEjabWv9130jxJ0RYUhRWa9kNayq2xJGxpe0q5F4pDM5hA/k8MRcVjmpR4PTgm2JMoUQSJVTFFEEyYrgxBUlpFEeJYT5ykBeU4WibOckac4Zz/V96TnOaSw1hRNZSda0pZWmH2ur/GN03lXgq647lhq0YkuoqvsSOUgdykSh2S22EW2zBGH7AfTjwUW6zXh5xNIlNVNdahKZVmNBBJIFDEyLmAbXB4aueSSxzGyyeGw3BlzsGuRY5MtWutGL5lCF0LKist70idV8K12oQRdcZ3IqC86ic60E21k9SCKX2QPezggDsoDYo/p52TNf9HFCaG1SKI29alPoqxDraA/IFeKJJudYrvcoK3pkw2wIqY4TfZjILVBjEj94TrVo1yUoCuuKUuiQrrKnnSlMwnlFs5jF9vZwU52pB3xX8wWVlrX1Ei2EvW0+qIB9Ymu6KsEIIcVrGKVaW1Kqc2kpcuaJyfdbq/oSpWhBF1xTbA2ll3oRg9a+o5dPTjBWrFN2yF2yv3pp/0VWhNeUJ9GsjkNRVPZjJo39Ht7RixiZun8vgUVXRE9N/INU/zqmBkR09V0s+xBt4Ca89NsFTvkVrFLbvfvWJIZb2ohW9KAxqKlbFTO5+JyKKAYuECRx9poQoGoSzKkGZF7tu6wwis8xlXk/7Og12CFa/k7/lTR1fk1kxkvetCFnqKzjPBbKIcNrBObTT8lH/BXZFFkaMshC0LCQ0LNYWZzW56/3AoVcIIc8kSePCXOy5PivDwnz4kSkWc/Lc7FXOhaVN4BpLBUFhHmSC1OVqUqUVQjkUSRJOvSIEiF3u1p067tXb8UQq78EJdJNbqhsYrcCrx2t0mn/PGjwoDFCeZkUy/Zi9aYAHxU4ZJstrBerJFb/bXdNhP17R3pSHNa0ABzgesodYKpQhHZ5HBcHJI55JJrytFyS/L6XQyu/lmVtXBzlD1WmsEU57gGZ63snJXY7eZ8+1HzueQLHjWuJhto9bmJ5jSkJbHGxxYp3FCCPtVrjZ2zlHCeU+xhJ7uv0XnH8DExQD73M7Oib8L/c16nhWt5us/7YMQ94cPjEysnxiS+E9dE3GlQQGTLtfwk1oet9BfVZQuzt6EDbWhvb3dJPus5HOIQh0S2zBbZ4kjKmUCFsyrLJBJkAokinsoyhkSiqCISZCTRRBGmAXYcHVvPj5R0dnbtgB3LBS6IPHmSi+SSY88mV/wiV5qOpZTaTFojWsqO9BA3e/ZmZM9r8rQukxBGBdy+j8m8R/5VPmtrJjjHQHFMoiWHKvo2/L8mmd6u5Z2Bi9oqaT1lynv3Lqh+lKMAFKET9AI2sU6stq/oc9R4/5kRsR3oSDva2FsTHkzlRKHcy24OyGxxWGSbDnq2rXpWxBTWEHVoIOrIBJKoST0SNNdIWy/GlxFeVolK0qPXJwHNbt1v38pOtjPN/OdIUdCF3jKV7s53u+kVPJOrTnld95v4E+MZx4KretaROlVHFP34tKJvwxVTizpsR996hdKSInajXfYxbyCyQuydTf1kur0TYRDluVFjm/hRrhXr8nZ5mZMEDanCNlux1ly2FrfQXbYpCj1IFZKCOuvuVYxIPeZvq62aVk+rJxqIOg4jW1G0ow2+jlGiZtmEJo5Fe9H5dWKVXCU/DimyD+YO0Vcuv34VKZ9gxujVmcko5lzFs3qOaiouivjqYOZDHkZwlvGujm9rptME+JER3GABi5dGZjNSRB8tTcQaC9DeNdqtfYx7fHGh00r6QFzhlpJWMQ4BXMe7nAFSeNEzEC2PnRxgNzvs2+TeMhXxmdNpHmJuSaIxLahPE5rQyF6prMt9Q2iUw+khe4DQ7OtFBu+Xjr6xzGvBKePCmEpr9l61sy7nGd2vVRV9E66QZ3gEgFgmsoH9QCgzaAxAdz5meEVX8HLIiDP3pC8DZCOfTbmnzjivDjiZ5y3mNpPWUt5C1zeHLa0CkB/xZsQkwoE83sTR886iNvddYDfb5XaxlY1pftrtRZHhzbVmsq5oJlrJ5jdk/Lk3JrrILrxszskakrKmoivjxlPQN3KKKKKo55OAJ5x/MuiqnXUmP7he/wn8WNE34QoZ6lqKII39QCu3INAPMzeMf1T5SGFrL/vIAXSX3pbrYyyXS1iVtjPtHzznu+fMiLguWrLobu/qeHs2uLacZB8tgc24B9jfb/tfm/LCUDokh57TzEaqsiDRyBWnZIHIk+fEaVkiTsk8CsUZWSQKQCvhPIgS83n9LqUhxIAwi1giZKSoLBOJJZpqJBFPAol6zXxAkuRTjLk2z+hy8BT0F7A4l2rSn+d02li4jbZsuUpnlYzkfm5FYwHfVPQtuGIu+CzrO22FvyYx7zvQOo5aXitzhYUlWFP9qEwzq5i6kyy70UGG6zvR4bglSOwS69i0qhJvla0pPu0p5ksamdvQjBZ0TndtCA2+Bc8lhzxOcELmmnLkYXHUdI4zvU9f7bRONpM9kSRTPa0+TURzWZcG/vvEsq8UN05aKX/VPMqXTGQyI3Xrhl01QQfJBCZU9MVfJb6mr3PpJIsB2MePdHeu+66iq3cpJHXU/chjBTZhTdkW6HVt11PkScNW7lb5nVPuxdYnO1AKxPEIZTHa38Ga8IIWsjVdaEUbqlxCNfPEIZnNcY5ySGSXHg875l8XrycrxB4jookXVYmQUSKaMCrLCCKpLPwN8/O5yAUtT5wV+fKU+VTxhdC8lBx+KttsC7M3o4XoIDvTycfjPsHSnB1X/xldHoHG6KWMJ1XnytiP1yu6ujckk0ngZRLZyqNO9x+NUXxMP0qZzIsVXT3/SGHtyJDHO+7yXH2OLCxma+/txgK+JOqxBu4w6whfd5F9rGSVXFd3Py8zniiWyYdwJH/Ipz+f0cV8odPSt9qKDedbB5ka6jT7yRYH5WGRzcFAJjYHU82VE8MStFqyjqhOokwU1WQiccRplfV6+eANbmVDBztmNGk5zs+c4BDZHCrdfnHnoJ+YAlkhsr3sRQq93QJv6vzrEHQ4w3zGun7VrejK3rD8h/8Q7uEzfYyhhGK/UY1rMyNiksUg623UxcOcfXi5+KNYY5yTxVbJfovoJVPo2j7MIJ9CjlwrNrBerk13+zr+nt8TRjHA3NDo1lonOlGphNAYbgumlrn7eVPuZV96QO/JNeEFdalHHVmT6tSnAUkk4Bwv+Yr0FSOoQQ33j0rFlr3sYLu2mbVp7/He3NDIbuI2MVLWB+30FZznKlOe1n2LTtCr/brUStcZX+/pkoqukhG2aPtghtPP2xjuYGlWqo9qVIqsNjKNdC2FCF+RKcwXE/nRvtYRje2LJZ5uoqfsSnvN+UXx24gfYye72Co/KrOXHdid9j+DKzBp9WRDGtCAutSnwfkaQSvIrgVhtKSlw+3Mslcsk1lySdpS+YLlZlEzZF4F1suL8gT9rG65Im+n4orJiDOPYJSWrEuaZGcN8/YNp5PxHpmJ9BO3ZqU5EkUYt4ubV6Q+7bt2TfiFdlpvutGJWoFaVHGc7Y4IdNO25FPOlR/5lrPUEM1pTH3Zgpu0hgECZyqWxrIx44Rm+cm6wDQldUZFV0dPeYKuN7OdU+35r5PMRDGMkfSWbn/EUyxknnlJ8ingVu/ytjB7b9JJpQMmTzEVx+VarMs76vp5nmeKN/WUN9PjfOcAYZ4FYhc75GaxzrTdJdyGJCZN+aNoJZvTjEh3La6wIy454/hXFHEBZBGeI/7KhBENhDq84S/jDCba0Y7nMmum/4q67u11y4E80lvTn55UJ4kQTnKKLWSRxRm/5d2RQnaPXoObHgynM/WpTAlH+YVlTOLncmrblAEkU53qhHGKk2wnCyt5l3A/KjOKPrQknlKOcoDZzPdTP3TzdpXib0IefdLBsx4fSjP1XMvnyAVq8iS3UovTZLOeb9hlcLxQejKAttQgkdPkcoBFLMavuCxOCBnJnfRwRXNLsVHOZfHJdca5T6rGTnuIfvY0n4isI2KpXC0z0hx1es97P1tDe6roRWfZRDO5bYuhuvG/OC5/EhvlVm1T6O5kzSVCVYAzZbJrM2mNZJs01z4NO9LRV6wl61nNLnIpIIKqVKcdffQVPs1p8jlTeuJMfvEp7aw8V3Ky/glxxlQo817S1oyiP62IpwZn+JlFfI2nOMZwJwNoQxxmDpp/rmV9wNIzhCrEUYPaJFKNWp6BqhpbWMF+TnKeaGrShhRqIiPEEL7TDZAc0e/685TJXrHLHFuX4fSkKVUwk0cOK5mlc0fQI3TJss67Bok9GEgn6lGFQnL4hUXMcYYkIDw+kOkuO7qDmuzRVfULxhuetC/v0NFg/QU+4e8cN9znAA2cSzto6bO1C594fGIclPJf/oi/AMQe/IUeBuuLmMC7HDbYUke39hMexcQzvOrjKpTPn/jIsC9zxlV2Bf4ilV7nNddyZ9brtiTp7swExpHOdK9zD/SKMIjiSZ4n3uC+fMfrHPRcuSKmaBhjSHW9TkUii1lyjoEPms0d1NLB60HaL549eGLfgb2/eKrDBrqvt+bWSVvo5VbU5uqCXAbxzAnWiQ1ivViTfMLjCNMZUbb4RMLQ+qKj6Chb0JYYSHe9kl15x6ey6/gA34iZkJIuC1+ZFHGCnPxDrnQP3XSuWI3Zh5mnec37E2Y+1/M/f1pLGIhKRZHvpq4cWOJlvTeda/DGpxNCivS6fkuSqYXWmPq0WNP5k5reL5eJfjxC1IS0xXzvWnkfEz0KZVL2RZvIfUBN/sadBuk1LDzGHp+1VXQf90HMA5L5F+18ypUygec5F7hFb8IUD5WNkWohmkk6zzBPKvEc4xh9yQExD/CZYT6REJ6mE30MRD2CT7nHz9HCeZR7GceUcs4ayreGkXxxfMAwBnOea0kzZnrZYY+T6fF7IBP8TGYQwj3cyV953aHjnxkRN0DeVTTQ1eqcFHOZG5ZhHDBqqzQ8wf3ObGSj5+ZIWni4TflQtzWt/W1b9s3csZTLbSeEKcgOefHn56cYZq4pDV05eEAxd+itHFVD3df1r2cbhf+x3/ZavnvaY5a+1IGBwHne9PgSl6HF7P/HlH/chaWIPHLFcZlHLoe0bFbLaekvMsRgDxawjXeTnV4VwdCLGX5yIqSxiUFYy9n/NV4zdPkP4SG6ksZJT0FvTAHRhFGLBvTkFg9xyzYQ9DrMpW3ACsQxh6eM1Ct+6ccXAaIUuvMej3mtS2QW3QIesxLf0Yi3A5Z5O0DAbgqLufWaivpffNwtPtN19QQv8WZAZWgYf6J9lbtntJX3MUKWtVpHxAw58+Ry4266pYYYLIdoKXUiAg6Ug0YUyp9Yf2Qf/yxbk+9zxxYnhHSlE21f7rPavTLQdZ3gIIfIZrvYbz946xAt0Js0suOEv64x1ZJ1SKAedbbHPuXaVOWxd9nuZzfJh7SiJq+y2e+hJ9CM9uHUopb+g/RxgMoc5s0GQad16cbCAH78lZhGSz89Ywdv8XKArW2ZwBDPqgSq+RM+3dco5vt8zc9TgkemDsy8z06ygrxkMx/pxPwIE9hLHL0Z5vzoXPSJmA4zEPMCion1+EwJ/syOACkumhE4TUA3/slDQV7DpdOWDl5rSjxCd1/TDQD8c1u1nOJwp/HqF6bzfeoaY5cXa1ttiBhERymuio35MOtZJldc+GlQCVDHLehlrIgp7CC60olOZQO2ADquAncvcsPitH66LVV41/3DvK9BZoMS6u7vcLCO4xpiGXivuNf4eiazsmw/qlLipTwqZgIml5hHEEeRVwmNyT5jSSuB1eq7BA8Edf+SmK4T80IKfZJVV+UFo+gCJ8O5X/frLCE+H43BdAv2m/M6833WTfAQ86V8gI1TQAitGcWTrjYqhMk0Jrj5o3u7xu6wmlRnN/1DujKHaqzjHh8V1b89xHwN/8ZCLmCmOSN42uVaKfiaVX6/i8kAaMxkJvs4RxI9uU9XF3iQH1gU5N26VBwD44l8wk4iacxtJOoGoqN51aP0ESazghziaMYI/Qdqd/jfeOmQaar2fdpGIxG3meydGC5Gyka6LtP58xdJvPyqb7GmpfnbVjVu2hhuJrmohQhsmi1gB1vZKXbYd/TJRiv71Jd6NC3V7zvuGl/3KH3tJtNNjuWVvE0hnXk+QD6wxc7bPIqOmIDjTPbooDqSB5oYzG3Oh57LNA9B/olSjwb6FB94nKESt9KRJCQ/H83IW9fYHgn4vTMelH3M5vM1Fk4DEfTkFXrpytzB7/x+kx1ifpFPmMpmCoEkBvOG260HuDMYQT/D83zps7Yvt7uWJS/wnqsipWxiE5+z2BXDlcSj/C2oi9bpgrpNet1U5kTOGh6lNW/j7bPVyRki6uAd/uQapdnZxjY+Z75LRRHLM/whwLmPMZS1zuUdZPE3/s4Trq2CV6+ZoAM879Rl53McfcqCJD7R9XEk7/BOmUEoyyL3Z4hPe7i73laWvmaf6HvwqeaEmxliv4va7jZc7JQLWRS9bP9iXYaZS+ZigOxs3e/irvKPsLfpE3uNex5CWBrTmhayGY1o/H68OyXCgyHuL0c3xmPmtnKj0h9gtKtMdZ7F5JViwcQruhuRyGMIprt+l5DjEe0z06Plas9LLl/xRjWTa57kdfuOS8lbe4ExzHL9KiSDLObQ37WmJjU4GmD/TYxiv+tXDp+TyXqd+3rH8gR9H9/wMScMtryuW/43//DZfpCBbHEphJ7hnwQz2Z3uo7xyh6hrDUstC6T5AaNZL/QqiIkGI5WjDGCHqyv0KG/5HWkXkOKVIa+QJwnlYdfvW+hkqK25Gqzx7fA6eV2XmENyf5nu1tJGjNPupFo6rXnGfsL1Utn/zFS9ujIrROvNUEZJV1IXUSiXMd88zzAX6xfVvxrQrmHvuFtCvTIzlp4t3Ja/9fCG+dvyinnWKADTUkd0lL2PpgTUvx1hndgqd255gPSyVU8eflIn5lkhKa7lTrdKnb5ZH/bu2fUfanyui3ojWKtNY6ZwRl4UheI0xVoB5xrFiRU6zwK0iW/etyKmMARMsSYzaDGtkqYvcr9fv1hrVRLVZTUqQYmHhrkZ73jVKJ6/m+/PPxFHsOjF3HnDeV4n6FAngKD/zACfvupB3ucN16/aekEvYKPHSPW/vOP34O25xbWc5ydV8l6+5lHncg3asy6IC9bbNF/t039BeGY/87aUX/yUrsdA1/IFfm9Y5hgf8opzOZYeflvl1wwTYT5HP529e8Q1E/SP/XTMqvOg7te7TISMONMYOY4OEuAs06t/ezafFS57fR0e4L8AUlhvYYx2u+7jeZS5zDVl+Q8KGZLy9N1efmcXWSUzzEvEZt2kSB45czLqi54iWaTK+hJDB9dSdrKJn0wb7ZtdLiQjPItYatBKtJJtaac1d8d2mjw6/PpERF/xor4FLyKbE+SJ4xySx0QeufYce+5T7XXmtZJtAw0Mi2s83vf3wWmZcL+FP7mVzS+9wTKABbGV6n4y/IxLiEy8YKBziOAl8zMEyVwfMQfYwT5ucv2KDbD/K4ZD0rk6QY/TC3oOqSzVjXjH+G1lcAVmAkzCX9KcH1yCDr2DEvQVuuUUVg54mEWWNtY2URbDTNx9dE97ut/E0T+4BB16+xH0Ar4wXH+Bj3UqoMC6/SvBn/lksG5g+AtvWLqJR+QIKgkoYQnflsxyJjb+mGdd5Ubw36wOcrR1lC4MaQvzmWteaziDmU5iYhu5vjcXWcUyaYtZHTgHesdU00EwVuqd2s/HrLFvCpxUaf7siLYkla8WbK0bVWew/8hjUzpsJdd+MDQnuXyzwQaOZVYJqVJaxVRJJojKMlzEyYiXIt0pYKKLZ/3No/N/BgnPxGx1rRibej/2XJGXlie26cO3Y1fW/052Fl1kU0/7QevoyG0XW5VbM8Cv6XezTtD9p9IsxniGt606tUK4Z9e9lLvY5OrZV2Yq3TF+zKkeT8Bfcke9yag9wfAj63We1x1YiyXtw3FLRg+w5qf6CoO+Fg391kJ/jf5qsdJvptuZOkHv7OVgdLU44dfnT5fV55b1b/8oHZ5i65hUOvlWvcffv92Cbuo9fZdWloFUYwUztDnGISe2aHt/Bj99yzb9So31/CgWR9n8Cbi18TOtXAHZhHpNZmDPcWd+/DEjzdeHzlTaxNTp8bZu44m5L4Gxc4j94mCXIxHPFLqi1g/Uev4ZZvNfdnk/EVu0VkPWFTXmdXa3U6kdX5Zgdz6+sv864Bb0pmEi3ffUzXALervX5GsmwKpZcp6JcK8/83Xq5wArYopuJpk0OpcJfMuD64MT9E1+1ut9Uf0L+l4/w9FSjrh6o2HeY/TD3M8s1ze+I//kccOD1NctpxMMwU2RILmHH3VJCATppH95/MtJA2dYRsvd6Z4Ogfpa9DD0iwu2Fpv87rGXM64xfiSxVz31NWDot+eguXvx3qESjor/aRPTdxkcYWdZWc10pGkcFEmbaa6cZTxZYWa8aaQcbE8hEg8r5PZZ5oeTjTQygK2a1lf2IVnWberOvFDGWdaItXKDad0YYXw1GXXNnWQnOtm7iDhJYnl5pQE4tkv8XtvnnpqYZSzUuRSbGc5wkV1j9jMrO8ZST9STtalGfXsUgPR4OeINQ+b0Q2jjCV4Np2QxUUP/Dfz4vSZ3iq1yc+HatEyRwcsZNc2D5G30Iazy2iDTr/mzBekHsv7tFn7z5HLGJegmX2XcHN7XpW58jGU6Nz43l26QqRpkuZ30ZDrNPNZV5/fzn5s/9YET1vHact1rfvVqcdLvHpIcnV2z6jURdP+PSvf+VftBfCUWGcWK28Lsg56p6m5jDqxv8V9tpnFuVmsDOYRB9JKuJ69p7pdo40++Yr4ipihVpMkUe0sjxfaZI7wl153a7HLK8VDiZcaLLqKj7CS6yurldIVK2cMOdrFNTi47z+EDqZ5OWjb6Mtkz1ZWsf/TpV57uzz0BZ0oOK3et8d7+mlF9+EN8DKkyFQTWPMtyrHJR6qd8mlmF+Mzgslrj1/Qc3Nxt/h25dEpZI637i3Sns+vX52wy8LUNXp9YRvBT226nAy+YntM81Q9m7powdMKzlurWNM3iFParV4tAU/joH4PeJfhSY/n8Wx0MlWMZNUseG+A+nzZ8pNGwIfMW8YB9BFVq6DqZ//rkX18blGwmhokRUu/MflAsZu72Pxg7C9lMpe1FCn2LehPmNYuJ3d0N2LU57RN/V9nnDvEwoqyj7A/5Z7GNnabdyWWegJN9alLN3lA0p7lsLhqdjf8f873Gk8XMJovnXdm7fAkpd63xp8BfM6qXQF2rn8Awhgksu5nLzLSVQb6fmt83I7iMBsV+t+j2DzHc8U42uioZwzRu9hGEs65P4EUGB1WdS8lyfZE3av7H/Obh0dIzk1gkn6S9LP9iu80yWM5K38NZXZs+MMAFl39TAj0SvXDrP+Xngu6llJX3h89o2Npe/o7bw0MryQtlrajJe9hgqSNGc690dNiLjpzRzYrgFa+X1UEbKUbIJi6BK2Ul87R5fRz95xe8z25JIk30s98qvH3ri1iHzWSdPZSnMGBRZGjHk73c7hURxnngfmFXbn2Xmuli/1fxQ+36Ez+jJc3tVdy5YmJ4nNF8z1yv5u4sr/Oi31Gk67tUQCH5oogL8iz2c4lunfrp1RxyynUkEcQJE8jY0urGsw5U0nnOFfl6rzalKU9l1k4PTtCDMTsHIqjPgfGn7gAP6iaIa8N/PIw8ACd149b1AcJRL5tfTvHE3z+eMXZNL3mLx4Y/ixXMtc23324ZO6hQ1xTu1jkMXDr1A2zTv+76UZNb6P0rSvSmKv+dft2jnmqOH8yTMgX4iS8Kn9LpXZuU2S1mRsQO4QHSpQmwYxWTxczta3WC7hrzWdvLO8QdWv0yQRHH5QLmhWf6mxGtYe0vXpH9uAWTRxt8jqUsF6vz1zojw7wSQc2MiOtGqkymM2FVMbl8lvRfVbFfrmcjW+2b+h4H5rmuS/fptCSJtrJVmmuAUMtPQE0VHuFuMpmP3hVA4580p9Z5TnCCPJGXE8bosm1L3r/jrfDCZO9O7lC3U/Ss6bPeMzjV8/y9bHHzG+1OkUh1alI/upm7sT9tnNcyTAwLUoSvVL0b1P7+HGam85EueGQcS5nksf0X3In9bw7gMRbL+cvPm/b77Vmv2NM/r/H9cN2rZeIPLEvWmGIzVU7XCfrNAQQ9msJybrp/w1ldXWDoeY/x0BnXkv8MppVdS5rfuHYXtmj7/fyOeqJQ/s/0UcoaoKdO0PuxDqwteUiOdZ5xi5hYOrnvcaCRLpN8MbvA2liOZoxs7BLxXXIOM1PWBE5A3P0Bj83FrBVZmuXiykF+W42bmn+6nM7S9akTRLm6LudhN+vYIDZqW9M8o75d90WcsbTUOpjayta0dISMBGfYiGYoQ4tW534ZfcB1rCLu/9zujkjo5hb0X3JvvZSsBIZMWjrJHbEx1/1G7jrb0NjG3ZNyJ2e+fvj3jPsd3XTxrR+zwSOj5TKdt+AIv4Iu+J4kni83yM4vKaUsyqj7UOHYtUffdK90JBxM1pjCzbpafOv3MJ/SgReYG+BEzenoJ8R/gG55vcc7uNM1tq1PpJ9RvrtF2hd4aGFraH/OPpZY9orntK9djiWzdTF1j87YX/lR6bAtHOZb83fJbruYLuQhYs38B7lTlhkpNVbwg3muvznJbQ3vrOWj9LWzmgyWlqwxnn44LNR9KQkNdZNPA1DXFSe2al9aM6P9EaJF2Y3s3lhuC9pmmUs2B8kWh2W2OCzzUo+nSUy863aVsgfnXX7lrHcL+nsLB/xedhVd6UJn/YD9Yq8babIx/4JeyB2sd1U1iml00Y2zrTpvuLG84532wMk4+gEW5vFCUPaUMuL03dw+hzmc2fu+Tb+U2cAjSOSIsxYuxNBRo6Yaz0c9jNHAHKw8H8CM9pqhrsHsERTrOcXOZt1dTDf8jFTVKTX9n5n69ScstPfFJCzyX+aFHk4tC7jgGgLWmPrtQ3CO6aZJYqlHqZv1Q6uHezg/QMXCyjwx29iv0GaSneVQhtqb6TNgXMxhsliqLU83tEKsCS/oSZpM/rjLdKPNJ+V603pt7aFh3OdYoTWiob53PTe0UltuFh0393jO1QdqHCDcRUqxVzso9opdHNSySw/2uwjEevWMNF6kj6tJqnONPB18boVueWja75nOdLCF2buQzjDaAPxQM+gw1etAoKrs4RFdK9mCj3XJHZbr3PPC+Z4UA2VbuivA5zb6cXuQ86BH8zzPcYtn+HD60tC5OmeXso7kVrd7jRSL/zttTNUs+Y3XS9qFr5xLqaxnHF/7Oe8gHjOIm3/RI0Jvlsc2/cP+AwsMtPC/043RV+OX5qkyj39oX/fx/RieFu/LP5b9mMrZCS8+7TPSbMw0t9I4if5CFEor00yzjOcOnxkR21MMs48wSmMx/dPpBgGxU83xHWUqyed7Oj46nlY2sZ/lrDStcuWBr1wm6Ahe4sGp5oRmdKKr7EQbwkF6RIX5NPlH3Oaz9YtT+3tsS+QV7qSh17sm2ewS9JLrNJnqMt3QPJwvGEgpJBezghW8bm3A0A13T2x7RWe4ygT+5nxHKuNcv8ayzOUoauddndNoZ5ZxL3oHqyie5VWd4/MvLAmiNqE8yGskAX9e8FSlo/pWq8QdsV2k0yq/7f585CeOanrvknves5rkTPPi5As4ssu8o+tO5QXsvn9IHH/XjeXN/N49hRCw0UtYN7LD1TXvxgQe8ei+Cx7TTd5Q6u3meHeSey6qvUtL+ht1kjMTxf0Fo+9xKQMkC+9feIo3PDQFw81f2iu7fw7bFPqeaXayoW11TXhBf3knA4l2SYNkQ26Cf1WkpYZIkwPoS7y/2LCNGanenm0z+chlqRg3Mq1KgtQZNUv5TOeCHu8IxP+FHWKrtlNs13b2yXeHqWr6XkslnuUFYoHXvaIahM6X0l9UxNXmAhN13iZ9+Z4H3Yra1IPsphGXEr12zSmvc/EUXXG78X3AOte0TP/jUV1QaQe2YMHGL0iSaM8ADw+EEu4Nyrz2ncuHeNht597/NmuHs9spGO8OX6l/6MtRJ6c7HTRmY9U5wjab+OHE5dE/pgyp88ao4jX5h9t6ZFjTeDCAYwwI3uFuJrGBU8TTkTFe2ez+4rPHV26dLPfQn8ls4BgaVWjDCA+N8Xx3/zgz0TRI3nUmxS3o+/b7irmlC88wgrCoosdt7/RwubcInmcsM/iRHKISujM6r7a+IxE2+ZMxnxhZ26uI/mLQ+QG60IjTYjGLShf3PY7NV9BtYfZuYoDsR2ufg+Wx+lAVt8m62EvzYDNpDR/ass+l3JxefyXJNCIOyRn2kOVh+6s33/Rm0a4B5aopgaUucf4dpbzp+qiG8JruDc0M4khXhw94SGdXG05vJmHjOKE0Y6RvZt2KpjxBv8AdrHV9nyOZRifnGKmEEWzQCZKJPvTxc5SnHHE/5fIfhpeZLbR7nhwavaLRqZ+3FlcjVe+jnv28OJzwRuZu8+SUUiR3skHnjSXodb6Xn2b71QDt+VmnCLQwEGcHM/AdmP6Xcbq+Z6KxdRm46LBVL2lkHsBIekgT20//00+0HTaTNlg+R0/ggPycL9/O5WH0TilJPObQHPgokpcV3+/ddV2cEDKUIfTVOb38JBbLBaYVxvOxZNQ395FD7MlEeR0ol6UsY6l5W7LGe76+KYsiw2+29xRd7LdQ9S3G6b7rR/1PP/fzxjFpwXoa/seVXFHwB8axhAOcoR4DdfYfO58HebQr5yAv8W/d73ie8ZgMHCD/Mly6rhHlqwt28KRuOsTGfM4dzuVDDGJ2uW6oGk/yCcGxjD/rkibFnh9g0AOdxtxU2JLZQr5qOWz+LjmX25jvmrrPL40//eyvKf43TyHabYwxYJtHgosyLnIfWcYO0XqiX5nVzPQ4/WQTpNgoXxXTU3eTZCToC2LDH9CekI0oZipfmC3OwcunFPFJAGt92TU8qDfo2KLtgxlDH9cAqlhmMVvMSwuQNHvUY6ZXfQR8GcvE0pSfjA1zZnNGX9JlV9FFiyjr3ifyNH8pf7BczAOX4FD8P9J0OqJEwymJ3wuQ9u3q8x+6B8gzCDv4IOg3/5oTjF7wK1J0CftvZ5kj3hlYRVdmBkwPeYT7ybiE+rxOKH8MkCxkTllN0nfw6pJGvGopERNSOzMjUAipODn4y6eq2NdYjrFUrDRtMojH1niASn7z2a5lgJ9O/xpSmOUnIgIAk/3h/SP/Qpg8ilX81b6oj9/0AZlNxHgeIlYe4hUmeEVPf81OJuls5d6c50/u9mVmRNwAOdo+QJcHdgHzxBJj5VxoqNtIHuEO+rnAjyxhSerWwJb3TrfKfuDttZFGSOm7puJACaROMQIbl8I48JvrF+CjgPmDrj4ad3HOb164vQyg63WtT0BCdOYP/1/6x2ioy0D1OItczikH6cQYXvW2pQKQxwd84Oeb/bPrzfBWn7yMjb8ZZKhGHJKvMkn/RvXdzx8sNeRjlqTil/tX43V9rJeLfD6W783Omw1Y6oje8l77Z5ZS1ovVSw7+9aAsO1oeRQxjPH/ziW7I5w0+DOBmuIa2PMdjRjZTE8ncdbLhdj6Si30izuzuOy/yMvuLp+StQJb4b95so6yt1gvF1sW1J0caBDoV8DnvOKLxs0Ls6eJ2hknnVYjjTNNmnFphnAd2SSPzcAa9dYs740YMlLKWDGExrUk2tPsvigzr/naHLYWhzva7qudHWWMna9nEuoGb3qzLHxhrONXaRT7nbxjG1QEHXB96z4st5V4W8WddV93NNl70SSteqHu3jedMKdCVOGNY4oyuhK+61M44ZvFPnVNTWU2/5EXyaanb29sX8Zhrm3//inzd/p6dW023xf8UlEd17xhXAxMd6EMXqpFAKOc4whasZF22F6+gKwNoRwOikORzjI2Ry2dXCZEFM418tBZFho4lTdvwx/XrO3ALSSQQxnmOs5llZPj6Jy2pHtJNdqEVrUSR3MpO9opse/bpI7fbiWAQg6lPdUo4wR4WsiQYNeKzjbYOP5lypokWXxRNSDTR9ip5dTe3XdBuceruwHtm1DSPlQ9yE+eZbP4geZtviTXhBaPkw/QANCyzsz6OKmlDEomc5yj7WYDV8QpmddXGcocrEHc3s5lrXmmYagJLO3GHHOzlYLqNTGEJW2rsHjvVHN+RW0mnq+EQ4iTLWSHXR2z02juJXvSgGVWpCpziFDtYyjIuP8O0mWRupQ11iERymsNsYomXh8P1xUx3BtGaGsRwgqOsZkqAwOMK4uoI+nVicULIGLLTZhtvtfbkXhkjZuTPGRZceB9gq2ZvTQvRQjYVDajOEfmzOEoeufIEp7lArrSLEvN5KCkV50KqAJRWMUUQSSzxsrpIkPHUoy6JRAL57BA72Kvt1zb1OSDKHaIuigwdzhj6Yma1mBA2xUjAMmqaH+YhWR3ELvk/7ds+hi+QpQZjxAPO8BbELmYwI9XQQWeqOaE3g+Vgj/y2Z1jKEjE/1c+UW5nNRD/S6GmgWLKzQ2TJlfb1fa8kzkBxHbhhBd3SxbzNKLdZRnMxhM3pfpxusyprdzNEHJBTzcuTg4lm02GrZL9JVJO1qSMSiZfVRBVZhTiDKZDgDKc4yxlyOEmuyOUIR0yH/CVs8GWqOT5Z3C5vpzI5fCsmpBrOLWDtzDNyFKFcEFO1z9JXGZXJiBMjTXfJZIfNVuyR08WU1K1GJbNCZBrD5VCdm4yUm8RiOffUWuOOfVZle7roz634zm9SwAZhk8vsq/teSkyiogK5YQUdrO3thX0MHWct7cQwtphmJfsJl8lsIe6iLzuZFp3Z9SoEFthMpc7WLKTgUj8fnqwJL+gtBzOMmpwVs+VkU4ZxIgntdvk4NwM7+FibZJRCQgpLLzGe4U6F214xmenGIm4Ls/cXQ+VAnX3kHFbmMT/NMOHFVHN8R9LoRzcfVe1puULYsJ7cevulxuIrKpgbWNDBVlVrJzYa64ot3bhLbg6Z5F/wsjrIUTKNI3KeNr9voAltrguWOqQwiP5EcYY5Ymb+IuMBhqWGHC8eoQYXxXQ+T11uVCajpnmsvB9HXrifxVQ5Jc0wO+1Uc0JveTujdHHzh5nBHL829DjTAAbR16cXc0YuN2VhNW1NvuxIREXFckMLOoClG5EnbX46lx20sRzSvuoTwBpra2gfxGARJ5fLLLm0z7VIBBUQW1V7T3qTRhtgL3OFxU9GW8DamqflWMLEHvmZ+Suj3KZTzfH9GM9AQoDz/CAmmmxGwjfVnJAib2eoqxXXWCPniEWpW4x1B7aGWn85mGSvRCv5cpkpS2aZf1IC/mvnhhd0mBkRO5Rf0lYYb81obnpclPKVa6IHQzLjRS+RInsjWc1qufbU7mvb+ZQiq4nsRCfZS7TDRB5WYcXmXwM/1Rx/G7+jJ3bm8N9Uq5E4ZtQ33cc4agOlLOJb8xzj/OzW9twvb3eloShlOTP5wThJ5NzQqJ5ykBggm3isLmKVzDJZxJqUK81+orhB+BUIOkBmMzrL5cZJiyEzUYynI7NLpvW7WM5xqoheJNOVZuxlCxvFVrHdeGhwOcyMiGsqm9OOrnQgFjjGcrFMWx2yKVCLmFHXPE4+QG3OiC/tHxpd41RzQn/5JOmYgM18xfdpOUZHsjW0j+F2l+d3EZlMN88xznqeWUXcylD6e0wMoIlNcqHMLF1b3n1U/Nr4lQg6gDVdNmGG8Svu6NSKuyngq9Qfyz/WzIi4jrIzLWhBCwrIFgflIXGQbI6InOAF31aJ6lp9WYPqNKAFTaiBCTjIOrldbNHW9Tlazv5h2lD5IGmYWMWHJTONxMuSxCOMpxaQw2TTpJSNRkfKjBejGU1X5/M8zQIxp3CRcbBIZrxpsBxFuocrSw4LyDBbgrccKH5d3LCCbqlz4bi3c8zc0KjRMtL8TbLfBLeZN4kH6cpS83Qj1xM/Z6olmssmor5sQGOaEEkxeeRxntNcQIozgCbzQVQBkJUJI5pYqpPgjF6yc5xDHBS75E6589yBYKz4U80JafIOhlKVo3wjvjHWl1u6iKflSMIolQvFlxcWGDkLzQ2NGijvo79zdH2GOeL7ggzj1E+WWuJ2Odxj3vsilpEpMlI2l2/3V/yauWEFXYqsTqWnfB0xsirLMZpW/K3/0Map5oR0xlBTLtHm9rmUvDYA2KKLk8yJxJNIVaJEAhFArCwTjXOiFI2TnOMMueRpeeSm517K8eeGVuolBnGHrM4FMYNv8zKNtAVzQysN52luAfbJL8VEY0NYRnPTg2K0rA4gCuUCvoueZ6zos9Thdka6WnyAQ2KBtijE6v+jqfgtccMKOkBGXVPLEptvh9ZWVRtPaOkXgYxmiyJDB4iRshFW5p1cdSPYfRfEhvfhVoaRQBGZTA2faexsaqtW+oh4hBqUMl9+ErLEaHy/JCpkpHzQOTfNRRYyI3yu8dGsDeRIhtDN9aRL+ZHFYkFg5aXit8YNLegghS2ZCykGnsyLE0IeJVL7zJ+CzsGa8HMpYhC3sI9MaUvfQwUw1ZzQhmQGyl6EksN8MT8sw1+6ZUs7nhSjZQTH+JqPjQNKrZ3leO4kBtBYxvemKcZaBVtDbZQcRhfXMy6QVjHdNOfqKR8Vvx5ucEEHWJwQ0l3sMjJNZcSZHqaunJa+tLxjZHXQ+pFCPdayUqwzbbky/7bgWBIV2kXrxs30oDKlrBULxYLkTf7GwlPN8UN5mHQki+Snp+Yb9UEWJ4TcwwOOvDdiDxPEt8aJHzNqmu7kLl2CpRNMY3b0sqvhJaj4dfIrEHQAa3vZ1LzEyFA0MyL2HnqxIvzbHufKO8qa8POd6UVvOrOfNWKdtk3bdbW9tTPjzW3szUztZBdaEcJFNoilLDOtDDQWtlW1j+FJGnOGr8VHqXsN70AvHpXDCAeOMFlOSTdMTm2Ltg/hHtJc6ra9zBZz8lbeCEMXRUXyKxF0kMIySFQ2TzdyEpHCmi7uk6fEhNRNwRwrK8TeVnSmFe1oI07IbWKfPGw6KA6SfTmqqQWxobVEY3GTqC8b0pbaQDHbWSvWsLFgx6CAE+bYTFo698thhIs9fGCaaHT+BbHh9/IwLYEiZosJpgxjX7iqfcTdDHPlMdvKD5die1D8tvnVCDqALdp+jyg0fWPc8bbWY5zWRVi1b8qzX7vJCpEtaURjmskGoqmszimOk8sJcjlHPrnOtBlnhASiZSiISkRQWUaQSBKJJFCXGEByjIPikNzFDrnVfCAYjzJrA22sGEddLohZfGWyGolvZjPTY/JeYoEdfCUnGmv4rZ3lXdxBTefPzUw3T/Y3YYPi/yc3rKDbWpX8bOSZbqnDOH65MNG4pcwKob82lnA5RyxIO1beOXz2rqzVFTVIlNWIF0myCrGyqqgMhLjyx1ykEDgrTspz4ow8Qa7IJVcete+9lCFARk3TXYyiC1Jkyf+ZfzBqx6XI6iOfoR+CfDGRb1LXGR3JUot7uN+VYmoL32hT+9xwSQ8UFc8NK+hga6VFGr/eSxqF3CMPmr/zp1LLrGIaJkeKMGb6m6ekorDWcxq7zGKP/J9ponHtVsQU3Scek82AlXxlnmL0IcgKkbfJ8dzqjETfJb8X04zj2hWKG1rQIbOKKYVNqYbTPWU2Md0j8wJFrtmq2YcylMpYTPNy1/uoo74kGXjPYHaWa4A7Tzrwk5gtf0jbbFwyq7b2NOOJo4BvzB8aj7GtTeX93OPM4ndYfM/k4HQTiv+/XDtBj3bmMvk5QGLFBgggL8A8o9Wf7hZTZbJ1f5mw1yYM0MgGsDW0P0Ex/0k74nd/bJVK08VQerCNLHMWO1wj4fkMAF7h7Wt2B4Cp5oRWMoW+9KYSBdLKQtMCfymbIKurfEqOJIyfxIeF3xv5/i2KDBshx9MLgBwxRfs+bXUFOa/G0J54qnKWE+SxH1/H32o4Zmg5fMUzgP+2cWQxKgmQnPUqcO0EvY1zTpeh+MnxRiP2AfARj/s9yn4aQt3Mr/+S6phQ8SdaA+fcMVeWGmIcCXJW6tJAL7zNpLWVKaTRVm4Tq8Xa0o19v7yWgp4ZT2e6iJ50JYZSNmDDEsiOvSgyZKR4nK6UMpOP0mxGZaxtecA5YfJFFsqJ5gUVFESawL3cRTuPKYeKWM8KJnnMmDeZOwGod+OlSryhcMzBvseZSOQacS277vtpCHzBeD/bn+WfAByhjp9s/82dUzUPWbLWnGbekrzNV9ABbGH2kQxgh/Z1+fFisr3WlZvp8fvEjRHQadpf3zHvuDruM7YwrZ5sITrIDrSmHlDAKrGSlaYfAxvtrK3lQ9xNZY7ykfGofVFkyEjxJJ0BiU1+FTGrfJ+Ba4RgPO8R7WdrT/RZA5SgB8evXtD/ybPAMWr5EWOLa9a0zhimQuJ3/AO4SAIXIKur1rn/E8VN8RF05+G6iHFEiylicTCCG2EpTIXBW56yi6acJlsc5CCHtKOmY/bc0LzyjzDVHJ8gEkiiHrVkEg1oQT1MSLLZznaxk81ie3kt7oqY4tHyQTqhYZGfXZztZUloTRLcKR8aJO+lMojjTOJzY3ea60Qo3+rmJsnmMMUkUo1EQoBDNPB40krQg+O6CPq1nMF5Ns8CNeiEke68snMWb4AhfgR9AAAZXABIWSPXduhoP7pv12lDa3LaWtZmxJnuYpbliPwmZHng9EeFhQBzps15e6q5agPRUjalBkNMjWWCKdGO5RznOE0upcB5h5ZBxgozEEUEcUSTiGOscJ5DHCKbpWTLA8F62i2KDB3M7UX9ieQIfzF/YWj1fok7ASkFRcwyTWBhhed7+dAp5sf4O5N10ytEczPdOeL1QZ+DQxsRzBSKimvMtRT0FeSRANxmKOj9CKVsNuwh/MmgRKwzOmtO2QohuT8rRN5DTVnD2EreJ59P+MTaVIyxv2HdIedGW8v3777dzj6ntgCArJCShJB4LcEUr0WZEgjThKgMjs6PvGAqAnmSfHFWy5O5oXnG6Zz8Y4su7ScGMYwYTovv5XcnrUbuqbZo+91/GrASKDrNa6ZvbohAlBTnIGwxd3rNa3KeTIN5TCczuaKrrLg+fIVEYpgThW+QSEahIZGGUzoNRyKxu7KfubBVsjxheT3zJgKS2dH6N8t2y/eZYzONJoKcj0Ty8vW7GZZalgct0ywFFmk5bZmUNcgWZlzO2sDyL0u+RSaXIpF+Z3e9/sxAIjnmd4SuuDyeRyLZfeUHCsS1bNFhFvcB7ajtM8NaCP2BHGawiQ7AEP7ls7ej474an+RRyRf4cE34+fstj5umpPidjCd9Axtsf5Cd5SD5lEXDImymFZfa/l4NbJW0nrIv6bRGiD18LOafX+HPAz6zo3hW3kEIu3lr1c0Mv/61DUAaAHNQqSp+hVxbQc/gApUQDORTry3dqQosRGOWH0EX9AfwZ5zrWsQnMyNiH7COZ55pjsd4vAqFZRPiJWusYQ2vWJJI43b755afWSXXaCt8UlbEEE0eAQNQdFQinAuUMyhYUj2kG91O9yhsHxrGOZaKz0wLPcbiZmLdNZ0bWmk4z9IVjTmmD1Ky4JI6vtGElukSgqAKYeRxaRFtUc4pma5u4udYzORfwTErEc3JoK8kijAKCMbGYiKunJJhVKWA4KwfMYRw7rftTTATiWSuz/p/IJGMBFojkZT4TBrQHolEeukix5FBhr7DLcUdL950tO7uV24iikdZRiESySlm0Nn7pFJktrCOt35h3Wk51CIHiaz97/ABTORnJJJSsvmaDgGvJ4X/8QsSicZ23vEeVkw1t3kkYctNuxfPm3X4UdlCmiUSaT5tmuyIIgfCSecfrOcYdiSSc2TUennmny0/W6Qlx/J3W0OgNRlkcByJ5CAZrr9+PvURDGUGJ5z3cAN/MLBHPEIGXwBQm9+TRQESSRFLDI7nH8EFJJJDRAS5RzoZZPCZ4bYw7mMx+UgkF1nGw4azrgaqzWBmcQyJ5DwZjCacnmSQ4WcW+f587yxdymZe1U1pUcY9ZPAdggReYj2lzmHK165Z6maTwQhA0JOP2O4cch7nQ2r7raWZO5jDKSSSYlbzrCu2UM916bpfa+5DIrngc4G7kRQ7X8p9SCT3epV4GYnEe7LhvyCRXm3dnUhk++1xBc5PQ9lfgNmpM+MT1iKRYZrXPhKN//p5lROY41P6dEIfa2Nr38xxlj9bJ1u2WAqflEhkr+zIAq+jlmkUJvocQyJrywmbLaPnlr3svYzKIH3m4m7Ejz5lDtPMq9R7SCRj+db5+ur/3rqEZ7ncuc8017zrgRmLRPKTwZab2e1Tkw0kBnVUgAauurj/TrAdiTQQpdpYfUofp71XqdeRSN7ntEe5Ilet8pFs4S62+RzrJB0Na9mSjT5l91Dfp9xvYIwO87BjJpI0j1a9KU2A5U7Dyyx+BwxhoseejhH67OBOA5taACScjz+Wt/+kpB2nAk2lm37SMat0sYCoPUn5NUwliUer/RIBCB5rNeZvq8JPiFwuUCCdHbitVV5+viABoPKJaue0Sr8kFoYAlUuX5BOLKCBbHmQZn69owpOwrB4g2cVOComnAztcev2l3IOdrRxKKqnXWGu+Pewi8AsPmJnh6nqfYwPQgKrAcd084nkeF9GeJSQAdrZxkKp0IQKoww+0NejE/8/5/585SgQtnC3oS1jICvIW/8dpBRlJe97hO4Kes9aLQUwlArjIdn6hOp0xAx2YwKCg9u/AEuIBO0vZQAENaElHEv18KJqSRQ1AYwf7iaUrlYAkZtICX43NU4DGdvZQRDU6kuUx+3gbvgOghN0UUM3Z2lflO1r4DB+6s4BYoIRtHCKBLoQBjZlKV36TGXdtSKTXGN3xDfud81cPZwdM307EO1uf7l5H89uiU8rnNAdbK+s/LFbLa6/2KKdeDq37Qprr1vU0bXZ8eW/JtLxjfd/ynWW+JcOyzrp+4YZ6hUhk3YL3dlozLQssU+Z83GO1o2ydLzP1w44nnC3Bv3WWBJNuYJJI3390sr5l2WORlmLL4m/Gh37h/Np792kmB9S6JzqHEBmuFrwKk5xHGudR8j1XW/+Kq5tZmQ+ca2dcwrP8Wtc25fAu7QKWNm7RW3EeiWSiMygH6pDlPGZ3yieeo84eQEvd2jrOFtm7RY919heX08a5JoZPnSWf9Sjp2L+Av+i64mZdFz/f2TPLZITrTe3AVuex+nvVsg65SCSzXW9BIj84y47wKvub6LrDM0gkv3j44C31GH2bnKNR/fd8jPNlMnkdzb+g6xI7TzVb0qyfWtZY/m7tPtWMMcbmtUjnS1ekm14Y4I84DIWec4RPcHYa9df2hPPFMsTa1vqWZatFWjTLastjmVUAEKwzFLnAgv45EskCj9nSTM5OqmdfxiHoc/G+E1OQSPIuwTvSzNuUeHRFd/GSS2C9MRJ04ex0/8djbRQHnMJfPp8gkWzzma29iaGgO67d5tGICGZ7vzGUCfosv+d1CLq3HaSmc/1fvdZPRyL53uOehzif82Kvsr8RQW/gfABuJVdVSpDoXTkdL+0XujXfIpF86XO0oATdwdxQa1/LJ9adlkmWOzN9Zzn3Z0ev41Q6PadbF8YJJBpdvMrWd6pk9KNiQ0HPqmwZZvnc8rNFWkotNssz1noem3+PRDr9+t0EEvQkSpAU+CiCUnAofqJ0697zI0SdnU+mHH8ELxrwERc9hL2Y6a7UF3qMBL07DoWe9yj/USSS/ZRHvPPpdPHZYiTosRQgKaaJV9mOztZZ/zEPTtB7+az/1Pkp0XMTGpLTPgrmoUgkZ70+uddF0E1XfohyOOiMYnO31/0JAebryswC4DZXbczcClzCCN2IQSWpS9IeyWslPqMdSzI3WP6ZNchA4L35mekApOvW9SURWM9ar7LZTuFs6e9gtkqWZOsbltVaHj8wEAt3maulJaf92ytU1fGCV76Ei7uDEGCuj3/CUs4DoUH5TW9yjrKTgijr5iCP0YDncSenDGUEP/GGH323J2MA+ArvXP0LAWhoqJXW059IYIXPkzBmOJWATLzTfG8gBxD+n9slsMrgHo5GAN9z0qvsEuxADPWCOvJV5Vor4wBm0xa4jTecvx0iv0BXIpNzxJDELTjmTetKPHCBjCs/+e12lrOcP2TG00cbafqXpVSsZY228VazX+PrfMaCLlkyTiWUkdJqJy3Bla3NRWTEvLvoInra2xIiz/IjL8r56bvwh8MibyZ4/NVIYzcdwW93Wk8pp6gJrjRZwXOc93iPJozlXuoAEMGr3MLgchV0jnpbfdYfclpmauqdkQ1wtKjBvheBnltSkHepPByz1Xl6C/q7ygtk0wioyXXP6Hc9BH0WrwIdqclRIJR+wDn0udiLWMjtwBCnoJcFs1zFOT3TTzKFKWCrZu9OqhjTofM6ILn3q9tLt4Yd9HC4cWRrSSDE5eLQFoAzVPE5rENvGweQVVu2kM0/GTUNuKkT37JPrucbVp7c4CfZclXqUpdKxNL6ki+nHQBnDWpU4K5RuTh088G0xEbs4U+8Rh9e4xYA+vAafwy4RxgtnHX0rfdZKoFRVKIHDj13sN1cx3PLNzjb+Uu4S4ExuoftADhncF6Hg015V3kNuB6CvplD1EMwkM+BXsQBmV5+ZbOcgv4CcMmmtUsh+QQzmQliAf0hIoYnzK20OMt+DoqDMkcc5cj6khcABDGcdu7k6PC/wzvGxxw09pk7qK9FAxdj8gAObzP1DBCI0pfh9KfuFVyGo0bf+d1+ae4nl4/GYpbwGq8B8CRvB3SQrezstaz3W6K8eju04MFG4zvu0qc+fpnX9i4JZy0X+C1xvZ6Ojush6JLZPAXcxucYddwdv4sJownN2UlN2gF25l3TSkmARfMWvQ22SvYmNJWNqC+7i2ot6jtKLNofeloUUwB3twycz6K0SMyR2SLbdIDsCY/xH8g/41fMm/Jfp9f4lRBVzvZrr3vR3UpepzXDgSh6BXi9y691+fV2WKArB1mzirlLEeUOwjzPu4XPgByuKddD0HEKehqRXGQQIH1eh3yyuBUYwk76I4BVXNIspVdC8gU2s9n1sy6HQFwI72+vQgxRhBW/QCNotbbWHoDCC/bSixfyzxcXnyk4WwiwcOPC9UGeqh4rSADymMYSdpPNRWDgJX/UTlEDeJeDfravvF73zskXTsNT7YClymbaecbvoKy8sasjFWiwY+tTVAPe97FnlLHqmtyLi1wkEnjVr/B6pvLMuBq6qPK4PoK+jFNUJYoUDtEQ2IhvEznLKejvXsuOe1C0AZA/6eLi+tEIts3aduUho6+QAOyit1OJc7mcoAawme8r7C5518dB4ECffAqJAGxc7lyu+0gFevNekLVqBuzw429/Le9GPWCtj8W8Ark+XbxSpzFtkLPjPt+gzBw0oAt16eP8XVEMBPCwhDuUP3dchbvVF4BXgxJzhwrPOGrdUaO7KugO+VIWV7C1nHJXWm+HWS3VICjlWpztcrnRng7Xbyw3C4CBfkboAEdZC5j4GzHATipkimOgNncDkkm6dY6PTlsevuKjO/Swwc0h4/gY1DTc5qjR4EuKP7tS4v360NXmFQD26gZAxjgiHp7yCbwJljkUA1FO5V/5pQGSuf063iX3ee+m23U+bwCul6Av5iJQh27ACcPUUmUfgzuAimvPY5hCNDDPo21a5azxv3WpES8Pxxj0Ia+1nQzLOmLmuxnqaKdzFBB8Z+Crda34gUN8SLpXfUzcwVrnqPmVciPLP6UIiGTeZYp6rtMr8gmfe2jEQqdVfoLTAet6MYnTgJkf/DxZT27jIR7ioati7LsBcId4fuWnRFOdW+UtfspcggtsOcx3+oq7QwxDGM4up/e6dzt6izPIRmMqXXSfxzgPDzoox9ed55zX9wkJzjXVKAtq8VbdlAWrvmJ4pDudW0v4xGmdLjteT6+S/lxgIRuJZEhQ96uOM35ecpol/J3neJRXmOSM8vYNXPIX1FIWfHKOtzwMjPV88wcYUsMZLqIxweV4G8oILIa+7gOdTsp2vnJa1R3Ek2xYr1l+z+vPBbaP843x5BFnbQp538M9uIZBK19WcyM34l8h41wvhP9WcbuzxDG/PY2rLegSyRGWMRWL65XNNYxkfxR37HoOy5nNMnZjR3pFGAcW9FBnQI/kPCuYyo+UIJ0x0N6CLnDG0rGH6WRwwMvH66+6D+PPLGU2KziA5IKX+8bVEfQXPPzbff/+6WNUMhZ0syuKSyLZi4U5rOIokmBnjrtZFzOew1r2ewTaeDvRvqzbdpRlzGY5+9Ao9TLSXV1BxxUjJ5EcxMZsfuQQklyfd/s3JujVnG1icYAuytvOS/7cb4mrK+i5zhZc/7fIb5BHOjsMXvBShnqUCizojsGB5xFs1MNmIOjQmjyPkue9hGk0hw1qVOSVVOHqCHo8j7PS1ap7/i0nxWAPf4knTDzPSYOjnAu689rYGfzs/tNY5UfQYSj7Dc5W4iW0V1vQYbyut+P+u+jzfl0XQb+ekyyOpyqQywS/JRoxEoAFfrW3vbkZ2Okxhm/OYOCkR/Rb+YyiIT+xmF4MpAPVkRxnPbMD2lYFqfShA4lU4gS5HGAZS/Gc5rEDfYBf+DbAcbpxNx2IJ5fNTMcKdCaVC17BmwDVeJxkkjjLETaxhkyvBAchDCSFNiQQQi457MPGCq+ECql0BrYZ2DoeJRb4geAnhajGrXSgBfFU5iL57GMj8/1EnbXkNvw97yiG0ovmVAVOcIxdWFkbdM47gB6MoCNJFJLNKmYgnLruKIN0EmZuJY22JBJGLifYx1KWe/nw9aA7sJcf/JzvGcKB73xmSKvPHWD47CCcQfSmNfGYyOU4e8hilU88wJ3OIJfPXJ6YCoXCD238tugKrq+rpEJx7XBY1mV5uXn/v6IEXfHbwJEq6uglJrH+f4MSdMVvA4fP4U9XeBSFQnED09Jp03m8oiuiUCiuFfFOj4OTl5AbXqFQ3NAMoJ8uuWQoo5wpneVViEVQKBQ3BIL9SC6wjSXMYoUzS7xEMuG6eoUoFIprSBvn7Hqef/k8r8Q8EOrmKH5txNCfQbSlNlXI5wSbWcJ0zlR0tRQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUCoVCoVAoFAqFQqFQKBQKhUKhUCgUl8H/AdZyLGjSITCjAAAAJXRFWHRkYXRlOmNyZWF0ZQAyMDE5LTA4LTIyVDA0OjM0OjQxLTA0OjAwpZloxwAAACV0RVh0ZGF0ZTptb2RpZnkAMjAxOS0wOC0yMlQwNDozNDo0MS0wNDowMNTE0HsAAAAASUVORK5CYII=" width="220" style="margin-bottom: 0.52rem;">
-""", unsafe_allow_html=True)
+metriken.starte_export()
+
+# Logo wie in Ergo-App (oben links, nicht zentriert); kommt als statische Datei
+# (static/logo.png), damit der Browser es einmal lädt und nicht bei jedem Rerun mitgeschickt bekommt
+st.markdown('<img src="app/static/logo.png" width="220" style="margin-bottom: 0.52rem;">', unsafe_allow_html=True)
 st.markdown("")
 
 
+@st.cache_resource
+def geocoder():
+    return lade_geocoder()
+
+@st.cache_resource
+def airline_index():
+    return AirlineIndex()
+
+@st.cache_resource
+def vorabsuche():
+    suche = Vorabsuche(geocoder(), resolver())
+    metriken.cache("vorabsuche", lambda: (suche.zusammengelegt, suche.gestartet))
+    return suche
+
+checkin_fristen = airline_index()
+
+
+def abflugort_geaendert():
+    # Ort schon suchen lassen, während Datum und Uhrzeit eingegeben werden
+    st.session_state["vorab"] = vorabsuche().vormerken(st.session_state["abflugort"].strip(),
+                                                       st.session_state.get("vorab"))
+
+
+# Jeder Abschnitt ist ein Fragment: eine Eingabe führt nur den eigenen Abschnitt neu aus,
+# nicht die ganze Seite.
+
 # Abschnitt 1: Check-in-Rechner
-st.subheader("Check-in-Rechner für Flugreisen")
-
-checkin_fristen = {
-    "4M": {"name": "Mavi Gök Airlines", "stunden": 24},
-    "ART": {"name": "SmartLynx Airlines", "stunden": 72},
-    "DE": {"name": "Condor", "stunden": 24},
-    "EW": {"name": "Eurowings", "stunden": 72, "hinweis": "Check-in evtl. kostenpflichtig"},
-    "LH": {"name": "Lufthansa", "stunden": 30},
-    "SR": {"name": "Sundair", "stunden": 48, "hinweis": "Reisepass erforderlich"},
-    "XC": {"name": "Corendon Airlines", "stunden": 72, "hinweis": "Check-in evtl. kostenpflichtig"},
-    "X3": {"name": "TUIfly", "stunden": 48, "hinweis": "Check-in evtl. kostenpflichtig"},
-    "XQ": {"name": "SunExpress", "stunden": 72, "hinweis": "Check-in evtl. kostenpflichtig, Reisepass erforderlich"},
-}
-
-airline_code = st.text_input("Airline-Kürzel (z. B. LH, X3, DE)", max_chars=5).upper().strip()
-
-if airline_code in checkin_fristen:
-    frist_vorgabe = checkin_fristen[airline_code]["stunden"]
-    st.success(f"{checkin_fristen[airline_code]['name']} – Check-in-Frist: {frist_vorgabe} h")
-else:
-    st.warning("Airline nicht erkannt – bitte Check-in-Frist manuell eingeben.")
-    frist_vorgabe = 0  # statt 72
-
-stunden_input = st.number_input("Check-in-Frist in Stunden", min_value=0, max_value=336, value=frist_vorgabe)
-
-abflugort = st.text_input("Abflugort (Stadt od. Land - kein 3-Letter!)", placeholder="z. B. San José, Costa Rica").strip()
-datum_checkin_str = st.text_input("Abflugdatum und Uhrzeit (z. B. 2405 1925)", placeholder="TTMM HHMM").strip()
-
-if st.button("Check-in-Zeit berechnen"):
-    if not abflugort or not datum_checkin_str:
-        st.error("Bitte alle Felder ausfüllen.")
+@st.fragment
+@metriken.gemessen("abschnitt_checkin")
+def abschnitt_checkin():
+    st.subheader("Check-in-Rechner für Flugreisen")
+
+    airline_code = st.text_input("Airline-Kürzel oder Name (z. B. LH, X3, DE, Condor)", max_chars=40).upper().strip()
+
+    regel = checkin_fristen.finde(airline_code) if airline_code else None
+    if regel:
+        frist_vorgabe = regel["stunden"]
+        st.success(f"{regel['name']} – Check-in-Frist: {frist_vorgabe} h")
     else:
-        try:
-            year = datetime.now().year
-            abflug_dt = datetime.strptime(datum_checkin_str, "%d%m %H%M").replace(year=year)
-            geolocator = Nominatim(user_agent="checkin_app")
-            location = geolocator.geocode(abflugort)
-            if not location:
+        st.warning("Airline nicht erkannt – bitte Check-in-Frist manuell eingeben.")
+        frist_vorgabe = 0  # statt 72
+        vorschlaege = checkin_fristen.suche(airline_code) if airline_code else []
+        if vorschlaege:
+            st.caption("Meinten Sie: " + " · ".join(
+                f"{e['iata'] or e['icao']} – {e['name']} ({e['stunden']} h)" for e in vorschlaege))
+
+    stunden_input = st.number_input("Check-in-Frist in Stunden", min_value=0, max_value=336, value=frist_vorgabe)
+
+    abflugort = st.text_input("Abflugort (Stadt od. Land - kein 3-Letter!)", placeholder="z. B. San José, Costa Rica",
+                              key="abflugort", on_change=abflugort_geaendert).strip()
+    datum_checkin_str = st.text_input("Abflugdatum und Uhrzeit (z. B. 2405 1925)", placeholder="TTMM HHMM").strip()
+
+    if st.button("Check-in-Zeit berechnen"):
+        if not abflugort or not datum_checkin_str:
+            st.error("Bitte alle Felder ausfüllen.")
+        else:
+            try:
+                abflug_dt = parse_abflug(datum_checkin_str)
+                vorab = vorabsuche().vormerken(abflugort, st.session_state.get("vorab"))
+                st.session_state["vorab"] = vorab
+                metriken.zaehle("vorabsuche_fertig" if vorab.fertig() else "vorabsuche_offen")
+                ergebnis = checkin_zeit(abflug_dt, vorab.ergebnis(), stunden_input, resolver())
+            except ValueError:
+                st.error("Ungültiges Datumsformat. Bitte TTMM HHMM eingeben.")
+            except OrtNichtGefunden:
                 st.error("Ort konnte nicht gefunden werden.")
+            except ZeitzoneUnbekannt:
+                st.error("Zeitzone konnte nicht bestimmt werden.")
+            except GeocoderServiceError:
+                # Ort nicht in der Ortstabelle und Nominatim nicht erreichbar (auch Timeouts)
+                st.error("Geocoder nicht erreichbar – bitte später erneut versuchen.")
             else:
-                tf = TimezoneFinder()
-                tz_name = tf.timezone_at(lng=location.longitude, lat=location.latitude)
-                if not tz_name:
-                    st.error("Zeitzone konnte nicht bestimmt werden.")
-                else:
-                    tz_local = pytz.timezone(tz_name)
-                    abflug_dt_local = tz_local.localize(abflug_dt)
-                    checkin_dt_local = abflug_dt_local - timedelta(hours=stunden_input)
-                    tz_de = pytz.timezone("Europe/Berlin")
-                    checkin_dt_de = checkin_dt_local.astimezone(tz_de)
-                    st.success("✅ Ergebnis:")
-                    st.markdown(f"**Abflugzeit (lokal):** {abflug_dt_local.strftime('%d.%m.%Y %H:%M')} ({tz_name})")
-                    st.markdown(f"**Check-in frühestens ab:** {checkin_dt_de.strftime('%d.%m.%Y %H:%M')} 🇩🇪 (deutsche Zeit)")
-                    if airline_code in checkin_fristen and "hinweis" in checkin_fristen[airline_code]:
-                        st.info(f"Hinweis zur Airline: {checkin_fristen[airline_code]['hinweis']}")
-        except ValueError:
-            st.error("Ungültiges Datumsformat. Bitte TTMM HHMM eingeben.")
+                st.success("✅ Ergebnis:")
+                st.markdown(f"**Abflugzeit (lokal):** {ergebnis.abflug_lokal.strftime('%d.%m.%Y %H:%M')} ({ergebnis.zeitzone})")
+                st.markdown(f"**Check-in frühestens ab:** {ergebnis.checkin_de.strftime('%d.%m.%Y %H:%M')} 🇩🇪 (deutsche Zeit)")
+                if regel and "hinweis" in regel:
+                    st.info(f"Hinweis zur Airline: {regel['hinweis']}")
+
+    st.markdown("**Sammelberechnung aus Buchungsliste**")
+    buchungsliste = st.file_uploader("Buchungsliste (CSV/XLSX mit Airline, Abflugort, TTMM HHMM)", type=["csv", "xlsx"])
+    if buchungsliste is not None and st.button("Liste berechnen", key="liste_berechnen"):
+        try:
+            buchungen = lese_buchungen(buchungsliste)
+        except Exception as e:
+            st.error(f"Liste konnte nicht gelesen werden: {e}")
+        else:
+            fortschritt = st.progress(0.0, text=f"0 von {len(buchungen)} Buchungen")
+            tabelle = st.empty()
+            bloecke = []
+            for block in berechne_liste(buchungen, checkin_fristen, geocoder(), resolver()):
+                bloecke.append(block)
+                fertig = sum(len(b) for b in bloecke)
+                fortschritt.progress(fertig / len(buchungen), text=f"{fertig} von {len(buchungen)} Buchungen")
+                tabelle.dataframe(pd.concat(bloecke), hide_index=True)
+            if bloecke:
+                st.session_state["sammel_ergebnis"] = pd.concat(bloecke)
+    if "sammel_ergebnis" in st.session_state:
+        ergebnis = st.session_state["sammel_ergebnis"]
+        if buchungsliste is not None and not st.session_state.get("liste_berechnen"):
+            st.dataframe(ergebnis, hide_index=True)
+        st.download_button("Ergebnis als CSV", ergebnis.to_csv(index=False, sep=";").encode("utf-8-sig"),
+                           file_name="checkin_zeiten.csv", mime="text/csv")
+
 
 # Abschnitt 2: Altersberechnung
-st.subheader("Altersberechnung")
-geburtsdatum_str = st.text_input("Geburtsdatum (TTMMJJJJ)", "")
-def parse_geburtsdatum(text):
-    if not text or len(text.strip()) != 8 or not text.strip().isdigit():
-        return "-"
-    try:
-        geb = datetime.strptime(text.strip(), "%d%m%Y")
-        heute = date.today()
-        alter = heute.year - geb.year - ((heute.month, heute.day) < (geb.month, geb.day))
-        return str(alter)
-    except:
-        return "-"
-alter = parse_geburtsdatum(geburtsdatum_str)
-if alter != "-":
-    st.success(f"Alter: {alter} Jahre")
-elif geburtsdatum_str:
-    st.warning("Bitte TTMMJJJJ eingeben")
+@st.fragment
+@metriken.gemessen("abschnitt_alter")
+def abschnitt_alter():
+    st.subheader("Altersberechnung")
+    geburtsdatum_str = st.text_input("Geburtsdatum (TTMMJJJJ)", "")
+    alter = parse_geburtsdatum(geburtsdatum_str)
+    if alter != "-":
+        st.success(f"Alter: {alter} Jahre")
+    elif geburtsdatum_str:
+        st.warning("Bitte TTMMJJJJ eingeben")
+
 
 # Abschnitt 3: Visum-Gültigkeit
-st.subheader("Visum-Gültigkeit")
-visum_start_str = st.text_input("Visum-Ausstellungsdatum (TTMMJJJJ)", "")
-visum_tage = st.number_input("Gültigkeit in Tagen", min_value=1, max_value=365, value=30)
-try:
-    visum_start = datetime.strptime(visum_start_str, "%d%m%Y").date()
-    visum_ablauf = visum_start + timedelta(days=visum_tage)
-    st.success(f"Ablaufdatum: {visum_ablauf.strftime('%d.%m.%Y')}")
-except:
-    if visum_start_str:
-        st.error("Ungültiges Datum. Format: TTMMJJJJ")
+@st.fragment
+@metriken.gemessen("abschnitt_visum")
+def abschnitt_visum():
+    st.subheader("Visum-Gültigkeit")
+    visum_start_str = st.text_input("Visum-Ausstellungsdatum (TTMMJJJJ)", "")
+    visum_tage = st.number_input("Gültigkeit in Tagen", min_value=1, max_value=365, value=30)
+    try:
+        ablauf = visum_ablauf(visum_start_str, visum_tage)
+        st.success(f"Ablaufdatum: {ablauf.strftime('%d.%m.%Y')}")
+    except ValueError:
+        if visum_start_str:
+            st.error("Ungültiges Datum. Format: TTMMJJJJ")
+
 
 # Abschnitt 4: Datumsdifferenz
-st.subheader("Datumsdifferenz in Tagen")
-datum1_str = st.text_input("Erstes Datum (TTMMJJJJ)", "")
-datum2_str = st.text_input("Zweites Datum (TTMMJJJJ)", "")
-try:
-    d1 = datetime.strptime(datum1_str.strip(), "%d%m%Y").date()
-    d2 = datetime.strptime(datum2_str.strip(), "%d%m%Y").date()
-    diff = abs((d2 - d1).days)
-    st.success(f"Unterschied: {diff} Tage")
-except:
-    if datum1_str and datum2_str:
-        st.error("Bitte beide Daten korrekt im Format TTMMJJJJ eingeben.")
+@st.fragment
+@metriken.gemessen("abschnitt_datumsdifferenz")
+def abschnitt_datumsdifferenz():
+    st.subheader("Datumsdifferenz in Tagen")
+    datum1_str = st.text_input("Erstes Datum (TTMMJJJJ)", "")
+    datum2_str = st.text_input("Zweites Datum (TTMMJJJJ)", "")
+    try:
+        diff = datumsdifferenz(datum1_str, datum2_str)
+        st.success(f"Unterschied: {diff} Tage")
+    except ValueError:
+        if datum1_str and datum2_str:
+            st.error("Bitte beide Daten korrekt im Format TTMMJJJJ eingeben.")
+
+
+# Abschnitt 5: Passagierliste (Alter, Visum, Reisedauer für ganze Gruppen)
+@st.fragment
+@metriken.gemessen("abschnitt_passagierliste")
+def abschnitt_passagierliste():
+    st.subheader("Passagierliste")
+    st.caption("Spalten: Name, Geburtsdatum, Reisedatum, Rückreise, Visum ab, Visum Tage – Daten als TTMMJJJJ")
+    eingefuegt = st.text_area("Liste einfügen (z. B. aus Excel kopiert)", height=150)
+    passagierdatei = st.file_uploader("oder Datei hochladen (CSV/XLSX)", type=["csv", "xlsx"], key="passagierdatei")
+    if not eingefuegt.strip() and passagierdatei is None:
+        return
+    try:
+        passagiere = lese_passagiere(passagierdatei, eingefuegt)
+    except Exception as e:
+        st.error(f"Liste konnte nicht gelesen werden: {e}")
+        return
+    ergebnis = berechne_passagiere(passagiere)
+    fehlerhaft = int((ergebnis["Fehler"] != "").sum())
+    if fehlerhaft:
+        st.warning(f"{fehlerhaft} von {len(ergebnis)} Zeilen mit ungültigen Angaben (Spalte Fehler)")
+    st.dataframe(ergebnis, hide_index=True)
+    st.download_button("Passagierliste als CSV", ergebnis.to_csv(index=False, sep=";").encode("utf-8-sig"),
+                       file_name="passagierliste.csv", mime="text/csv")
+
+
+# Debug-Panel, nur mit CHECKIN_METRIKEN=1
+@st.fragment
+def debug_panel():
+    with st.expander("Debug: Messwerte"):
+        st.button("Aktualisieren")
+        werte = metriken.schnappschuss()
+        st.dataframe(pd.DataFrame(
+            [{"Schritt": name, "Anzahl": anzahl, "Mittel (ms)": round(summe / anzahl * 1000, 3),
+              "p50 ≤ (ms)": metriken.quantil(buckets, 0.5) * 1000, "p95 ≤ (ms)": metriken.quantil(buckets, 0.95) * 1000}
+             for name, (anzahl, summe, buckets) in sorted(werte["schritte"].items())]
+        ), hide_index=True)
+        for name, (treffer, fehlschlaege) in sorted(werte["caches"].items()):
+            gesamt = treffer + fehlschlaege
+            st.markdown(f"**Cache {name}:** {treffer} Treffer, {fehlschlaege} Fehlschläge"
+                        + (f" ({treffer / gesamt:.0%} Trefferquote)" if gesamt else ""))
+        for ereignis, anzahl in sorted(werte["ereignisse"].items()):
+            st.markdown(f"**{ereignis}:** {anzahl}")
+        st.markdown("**Zeitzonen-Resolver**")
+        st.json(resolver().statistik())
+        st.markdown("**Vorabsuche**")
+        st.json(vorabsuche().statistik())
+        st.download_button("Prometheus-Export", metriken.prometheus_text(), file_name="checkin_metriken.prom")
+
+
+abschnitt_checkin()
+abschnitt_alter()
+abschnitt_visum()
+abschnitt_datumsdifferenz()
+abschnitt_passagierliste()
+if metriken.AKTIV:
+    debug_panel()
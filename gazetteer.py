@@ -0,0 +1,208 @@
+"""Offline-Gazetteer für die Abflugort-Suche.
+
+Die Ortstabelle wird einmalig aus einem GeoNames-Dump (z. B. cities15000.txt,
+optional mit countryInfo.txt) in eine SQLite-Datei gebaut:
+
+    python gazetteer.py cities15000.txt countryInfo.txt -o orte.sqlite
+
+Zur Laufzeit wird die Datei nur lesend (memory-mapped) geöffnet. Nominatim
+wird nur noch gefragt, wenn der Ort nicht in der Tabelle steht.
+"""
+import argparse
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import namedtuple
+
+import metriken
+
+STANDARD_PFAD = os.environ.get(
+    "CHECKIN_GAZETTEER", os.path.join(os.path.dirname(os.path.abspath(__file__)), "orte.sqlite")
+)
+
+# latitude/longitude wie bei geopy, damit beide Ergebnisse gleich behandelt werden können
+Ort = namedtuple("Ort", ["name", "land", "latitude", "longitude", "zeitzone"])
+
+_UMLAUTE = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue"})
+_NICHT_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def falte(text, umlaute=False):
+    """Normalisiert einen Ortsnamen zu einem Suchschlüssel ("San José" -> "san jose")."""
+    text = text.strip().lower()
+    if umlaute:
+        text = text.translate(_UMLAUTE)
+    text = unicodedata.normalize("NFKD", text.replace("ß", "ss"))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return _NICHT_ALNUM.sub(" ", text).strip()
+
+
+def schluessel(name):
+    """Alle Suchschlüssel eines Namens (mit "ü" -> "u" und "ü" -> "ue")."""
+    return {s for s in (falte(name), falte(name, umlaute=True)) if s}
+
+
+SCHEMA = """
+CREATE TABLE orte (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    land TEXT NOT NULL,
+    lat REAL NOT NULL,
+    lng REAL NOT NULL,
+    einwohner INTEGER NOT NULL,
+    zeitzone TEXT
+);
+CREATE TABLE namen (schluessel TEXT NOT NULL, ort_id INTEGER NOT NULL);
+CREATE TABLE laender (schluessel TEXT PRIMARY KEY, land TEXT NOT NULL, hauptstadt TEXT);
+"""
+
+
+def baue_gazetteer(staedte_pfad, ziel_pfad, laender_pfad=None):
+    """Baut die SQLite-Ortstabelle aus einem GeoNames-Dump und gibt die Anzahl Orte zurück."""
+    if os.path.exists(ziel_pfad):
+        os.remove(ziel_pfad)
+    con = sqlite3.connect(ziel_pfad)
+    con.executescript(SCHEMA)
+    anzahl = 0
+    with open(staedte_pfad, encoding="utf-8") as f:
+        for zeile in f:
+            spalten = zeile.rstrip("\n").split("\t")
+            if len(spalten) < 18:
+                continue
+            ort_id, name, asciiname, alternativ = int(spalten[0]), spalten[1], spalten[2], spalten[3]
+            con.execute(
+                "INSERT INTO orte VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (ort_id, name, spalten[8], float(spalten[4]), float(spalten[5]),
+                 int(spalten[14] or 0), spalten[17] or None),
+            )
+            namen = {name, asciiname, *alternativ.split(",")}
+            keys = set().union(*(schluessel(n) for n in namen if n))
+            con.executemany("INSERT INTO namen VALUES (?, ?)", ((k, ort_id) for k in keys))
+            anzahl += 1
+    if laender_pfad:
+        with open(laender_pfad, encoding="utf-8") as f:
+            for zeile in f:
+                if zeile.startswith("#"):
+                    continue
+                spalten = zeile.rstrip("\n").split("\t")
+                if len(spalten) < 6:
+                    continue
+                iso, iso3, land_name, hauptstadt = spalten[0], spalten[1], spalten[4], spalten[5]
+                for k in schluessel(land_name) | {iso.lower(), iso3.lower()}:
+                    con.execute("INSERT OR IGNORE INTO laender VALUES (?, ?, ?)", (k, iso, hauptstadt or None))
+    con.execute("CREATE INDEX namen_schluessel ON namen (schluessel)")
+    con.commit()
+    con.execute("VACUUM")
+    con.close()
+    return anzahl
+
+
+class Gazetteer:
+    """Lesender Zugriff auf die Ortstabelle, eine SQLite-Verbindung pro Thread."""
+
+    def __init__(self, pfad=STANDARD_PFAD):
+        if not os.path.exists(pfad):
+            raise FileNotFoundError(pfad)
+        self.pfad = pfad
+        self._lokal = threading.local()
+
+    def _con(self):
+        con = getattr(self._lokal, "con", None)
+        if con is None:
+            con = sqlite3.connect(f"file:{self.pfad}?mode=ro", uri=True)
+            con.execute("PRAGMA mmap_size = 268435456")
+            self._lokal.con = con
+        return con
+
+    def _ort(self, name_key, land=None):
+        sql = ("SELECT o.name, o.land, o.lat, o.lng, o.zeitzone FROM namen n JOIN orte o ON o.id = n.ort_id "
+               "WHERE n.schluessel = ?")
+        params = [name_key]
+        if land:
+            sql += " AND o.land = ?"
+            params.append(land)
+        zeile = self._con().execute(sql + " ORDER BY o.einwohner DESC LIMIT 1", params).fetchone()
+        return Ort(*zeile) if zeile else None
+
+    def _land(self, key):
+        return self._con().execute("SELECT land, hauptstadt FROM laender WHERE schluessel = ?", (key,)).fetchone()
+
+    def suche(self, text):
+        """Sucht "Stadt", "Stadt, Land" oder "Land"; gibt ein Ort-Tupel oder None zurück."""
+        key = falte(text)
+        if not key:
+            return None
+        if "," in text:
+            name, land = text.split(",", 1)
+            treffer = self._land(falte(land))
+            ort = self._ort(falte(name), treffer[0] if treffer else None)
+            if ort:
+                return ort
+        ort = self._ort(key)
+        if ort:
+            return ort
+        treffer = self._land(key)
+        if treffer and treffer[1]:
+            return self._ort(falte(treffer[1]), treffer[0])
+        return None
+
+
+class Geocoder:
+    """Erst Gazetteer, bei Fehlschlag Nominatim (höchstens eine Anfrage pro Intervall)."""
+
+    def __init__(self, gazetteer=None, user_agent="checkin_app", min_intervall=1.0):
+        self.gazetteer = gazetteer
+        self.user_agent = user_agent
+        self.min_intervall = min_intervall
+        self.treffer = 0
+        self.fallbacks = 0
+        self._nominatim = None
+        self._lock = threading.Lock()
+        self._naechster_start = 0.0
+
+    def geocode(self, text):
+        if self.gazetteer is not None:
+            with metriken.messen("gazetteer"):
+                ort = self.gazetteer.suche(text)
+            if ort:
+                self.treffer += 1
+                return ort
+        self.fallbacks += 1
+        with self._lock:
+            if self._nominatim is None:
+                from geopy.geocoders import Nominatim
+                self._nominatim = Nominatim(user_agent=self.user_agent)
+            # Startzeitpunkt reservieren; die Anfrage selbst läuft außerhalb des Locks,
+            # damit mehrere Threads sich überlappen, aber höchstens eine pro Intervall startet
+            start = max(time.monotonic(), self._naechster_start)
+            self._naechster_start = start + self.min_intervall
+        warten = start - time.monotonic()
+        if warten > 0:
+            time.sleep(warten)
+        try:
+            with metriken.messen("nominatim"):
+                return self._nominatim.geocode(text)
+        except Exception as e:
+            from geopy.exc import GeocoderTimedOut
+            metriken.zaehle("geocoder_timeout" if isinstance(e, GeocoderTimedOut) else "geocoder_fehler")
+            raise
+
+
+def lade_geocoder(pfad=STANDARD_PFAD):
+    """Geocoder mit Gazetteer, falls die Ortstabelle gebaut wurde, sonst nur Nominatim."""
+    geocoder = Geocoder(Gazetteer(pfad) if os.path.exists(pfad) else None)
+    metriken.cache("gazetteer", lambda: (geocoder.treffer, geocoder.fallbacks))
+    return geocoder
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Baut die Ortstabelle aus einem GeoNames-Dump.")
+    parser.add_argument("staedte", help="GeoNames-Städtedatei, z. B. cities15000.txt")
+    parser.add_argument("laender", nargs="?", help="optional: GeoNames countryInfo.txt")
+    parser.add_argument("-o", "--ausgabe", default=STANDARD_PFAD)
+    args = parser.parse_args()
+    n = baue_gazetteer(args.staedte, args.ausgabe, args.laender)
+    print(f"{n} Orte nach {args.ausgabe} geschrieben.")
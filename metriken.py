@@ -0,0 +1,188 @@
+"""Messpunkte für die heißen Pfade (Geocoding, Zeitzonen, Berechnungen).
+
+Eingeschaltet wird mit CHECKIN_METRIKEN=1. Ausgeschaltet liefert messen() einen
+geteilten Null-Kontext und zaehle() kehrt sofort zurück; es wird nichts
+gespeichert. Eingeschaltet landen die Dauern in festen Histogramm-Buckets.
+
+Export im Prometheus-Textformat:
+  - CHECKIN_METRIKEN_PORT=9464   -> http://localhost:9464/metrics
+  - CHECKIN_METRIKEN_DATEI=pfad  -> Datei, alle 15 s neu geschrieben
+    (z. B. für den textfile-Collector des node_exporter)
+"""
+import bisect
+import contextlib
+import functools
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+log = logging.getLogger(__name__)
+
+AKTIV = os.environ.get("CHECKIN_METRIKEN", "").lower() in ("1", "true", "ja")
+
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_histogramme = {}  # schritt -> [bucket-zähler..., +Inf], summe
+_ereignisse = {}
+_caches = {}  # name -> Funktion, die (treffer, fehlschlaege) liefert
+_NULL = contextlib.nullcontext()
+
+
+class _Messung:
+    __slots__ = ("schritt", "start")
+
+    def __init__(self, schritt):
+        self.schritt = schritt
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        beobachte(self.schritt, time.perf_counter() - self.start)
+        return False
+
+
+def messen(schritt):
+    """Kontextmanager, der die Dauer des Blocks unter dem Namen schritt festhält."""
+    return _Messung(schritt) if AKTIV else _NULL
+
+
+def gemessen(schritt):
+    """Dekorator-Variante von messen(); ausgeschaltet bleibt die Funktion unverändert."""
+    def dekorator(funktion):
+        if not AKTIV:
+            return funktion
+
+        @functools.wraps(funktion)
+        def mit_messung(*args, **kwargs):
+            with _Messung(schritt):
+                return funktion(*args, **kwargs)
+        return mit_messung
+    return dekorator
+
+
+def beobachte(schritt, sekunden):
+    if not AKTIV:
+        return
+    i = bisect.bisect_left(BUCKETS, sekunden)
+    with _lock:
+        eintrag = _histogramme.get(schritt)
+        if eintrag is None:
+            eintrag = _histogramme[schritt] = [[0] * (len(BUCKETS) + 1), 0.0]
+        eintrag[0][i] += 1
+        eintrag[1] += sekunden
+
+
+def zaehle(ereignis, anzahl=1):
+    """Zählt ein Ereignis, z. B. "geocoder_timeout"."""
+    if not AKTIV:
+        return
+    with _lock:
+        _ereignisse[ereignis] = _ereignisse.get(ereignis, 0) + anzahl
+
+
+def cache(name, statistik):
+    """Meldet einen Cache an; statistik() liefert (treffer, fehlschlaege)."""
+    _caches[name] = statistik
+
+
+def schnappschuss():
+    """Aktuelle Werte: {"schritte": {name: (anzahl, summe, buckets)}, "ereignisse": ..., "caches": ...}."""
+    with _lock:
+        schritte = {k: (sum(v[0]), v[1], list(v[0])) for k, v in _histogramme.items()}
+        ereignisse = dict(_ereignisse)
+    caches = {name: statistik() for name, statistik in list(_caches.items())}
+    return {"schritte": schritte, "ereignisse": ereignisse, "caches": caches}
+
+
+def quantil(buckets, q):
+    """Obergrenze des Buckets, in dem das Quantil q liegt (grobe Schätzung wie bei Prometheus)."""
+    gesamt = sum(buckets)
+    if not gesamt:
+        return None
+    ziel, laufend = q * gesamt, 0
+    for grenze, n in zip(BUCKETS + (float("inf"),), buckets):
+        laufend += n
+        if laufend >= ziel:
+            return grenze
+    return float("inf")
+
+
+def prometheus_text():
+    werte = schnappschuss()
+    zeilen = [
+        "# HELP checkin_schritt_sekunden Dauer einzelner Schritte.",
+        "# TYPE checkin_schritt_sekunden histogram",
+    ]
+    for schritt, (anzahl, summe, buckets) in sorted(werte["schritte"].items()):
+        laufend = 0
+        for grenze, n in zip(BUCKETS, buckets):
+            laufend += n
+            zeilen.append(f'checkin_schritt_sekunden_bucket{{schritt="{schritt}",le="{grenze}"}} {laufend}')
+        zeilen.append(f'checkin_schritt_sekunden_bucket{{schritt="{schritt}",le="+Inf"}} {anzahl}')
+        zeilen.append(f'checkin_schritt_sekunden_sum{{schritt="{schritt}"}} {summe}')
+        zeilen.append(f'checkin_schritt_sekunden_count{{schritt="{schritt}"}} {anzahl}')
+    zeilen += ["# HELP checkin_ereignisse_total Gezählte Ereignisse (Fehler, Timeouts).",
+               "# TYPE checkin_ereignisse_total counter"]
+    for ereignis, n in sorted(werte["ereignisse"].items()):
+        zeilen.append(f'checkin_ereignisse_total{{ereignis="{ereignis}"}} {n}')
+    zeilen += ["# HELP checkin_cache_treffer_total Cache-Treffer.", "# TYPE checkin_cache_treffer_total counter"]
+    zeilen += [f'checkin_cache_treffer_total{{cache="{name}"}} {t}' for name, (t, _) in sorted(werte["caches"].items())]
+    zeilen += ["# HELP checkin_cache_fehlschlaege_total Cache-Fehlschläge.",
+               "# TYPE checkin_cache_fehlschlaege_total counter"]
+    zeilen += [f'checkin_cache_fehlschlaege_total{{cache="{name}"}} {f}'
+               for name, (_, f) in sorted(werte["caches"].items())]
+    return "\n".join(zeilen) + "\n"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        daten = prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(daten)))
+        self.end_headers()
+        self.wfile.write(daten)
+
+    def log_message(self, *args):
+        pass
+
+
+def _schreibe_datei(pfad, intervall):
+    while True:
+        tmp = pfad + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(prometheus_text())
+        os.replace(tmp, pfad)  # atomar, damit der Scraper nie eine halbe Datei liest
+        time.sleep(intervall)
+
+
+_export_gestartet = False
+
+
+def starte_export():
+    """Startet /metrics-Endpunkt und/oder Dateiexport laut Umgebung; mehrfacher Aufruf ist harmlos."""
+    global _export_gestartet
+    with _lock:
+        if _export_gestartet or not AKTIV:
+            return
+        _export_gestartet = True
+    port = os.environ.get("CHECKIN_METRIKEN_PORT")
+    if port:
+        try:
+            server = ThreadingHTTPServer(("127.0.0.1", int(port)), _Handler)
+        except OSError as e:
+            # z. B. Port belegt; die App läuft ohne /metrics weiter
+            log.warning("Metriken-Export auf Port %s nicht möglich: %s", port, e)
+        else:
+            threading.Thread(target=server.serve_forever, name="metriken-http", daemon=True).start()
+    pfad = os.environ.get("CHECKIN_METRIKEN_DATEI")
+    if pfad:
+        threading.Thread(target=_schreibe_datei, args=(pfad, 15.0), name="metriken-datei", daemon=True).start()
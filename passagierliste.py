@@ -0,0 +1,128 @@
+"""Alter, Visum-Ablauf und Reisedauer für ganze Passagierlisten.
+
+Alle Daten (TTMMJJJJ) werden auf einmal in NumPy-datetime64-Arrays umgerechnet
+statt Zeile für Zeile mit strptime. Ungültige Felder werden in der Spalte
+"Fehler" der jeweiligen Zeile vermerkt, die übrigen Zeilen rechnen normal.
+"""
+import io
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from gazetteer import falte
+
+SPALTEN = {
+    "name": ["name", "passagier", "reisender"],
+    "geburtsdatum": ["geburtsdatum", "geburt", "geb", "geburtstag"],
+    "reisedatum": ["reisedatum", "hinreise", "abflug", "reisebeginn"],
+    "rueckreise": ["rueckreise", "ruckreise", "rueckreisedatum", "reiseende", "rueckflug"],
+    "visum_ab": ["visum ab", "visum", "visum ausstellung", "visum ausstellungsdatum"],
+    "visum_tage": ["visum tage", "gultigkeit", "gueltigkeit", "tage"],
+}
+
+
+def lese_passagiere(datei=None, text=None):
+    """Liest eine hochgeladene Datei (CSV/XLSX) oder eingefügten Text (Tab, ; oder ,) als Tabelle."""
+    if datei is not None and getattr(datei, "name", "").lower().endswith((".xlsx", ".xls")):
+        df = pd.read_excel(datei, dtype=str)
+    else:
+        if datei is not None:
+            datei.seek(0)  # Streamlit liefert bei jedem Rerun dasselbe Dateiobjekt
+            text = datei.read()
+            text = text.decode("utf-8-sig") if isinstance(text, bytes) else text
+        text = (text or "").strip("\n")
+        kopf = text.split("\n", 1)[0]
+        # Trennzeichen aus der Kopfzeile; ohne Tab, ; oder , ist es eine einzelne Spalte
+        sep = next((z for z in ("\t", ";", ",") if z in kopf), None)
+        if sep:
+            df = pd.read_csv(io.StringIO(text), dtype=str, sep=sep)
+        else:
+            zeilen = [z.strip() for z in text.splitlines() if z.strip()]
+            df = pd.DataFrame({kopf.strip(): zeilen[1:]}, dtype=str)
+    umbenennung = {}
+    for spalte in df.columns:
+        key = falte(str(spalte))
+        for ziel, namen in SPALTEN.items():
+            if key in namen and ziel not in umbenennung.values():
+                umbenennung[spalte] = ziel
+    df = df.rename(columns=umbenennung)
+    if "geburtsdatum" not in df and "visum_ab" not in df and "reisedatum" not in df:
+        raise ValueError("Keine Datumsspalte erkannt (Geburtsdatum, Reisedatum, Rückreise, Visum ab).")
+    return df.reset_index(drop=True)
+
+
+def parse_daten(texte):
+    """TTMMJJJJ-Texte -> (datetime64[D]-Array mit NaT, Maske gültig)."""
+    texte = np.char.strip(np.asarray(pd.Series(texte).fillna(""), dtype=str))
+    form = (np.char.str_len(texte) == 8) & np.char.isdigit(texte)
+    zahl = np.where(form, texte, "0").astype(np.int64)
+    tag, monat, jahr = zahl // 1_000_000, zahl // 10_000 % 100, zahl % 10_000
+    gueltig = form & (monat >= 1) & (monat <= 12) & (tag >= 1) & (jahr >= 1)
+    erster = ((jahr - 1970) * 12 + monat - 1).astype("datetime64[M]")
+    datum = erster.astype("datetime64[D]") + (tag - 1).astype("timedelta64[D]")
+    # 31.02. landet im März: dann passt der Monat nicht mehr
+    gueltig &= datum.astype("datetime64[M]") == erster
+    return np.where(gueltig, datum, np.datetime64("NaT")), gueltig
+
+
+def _jahr_mmtt(datum):
+    jahr = datum.astype("datetime64[Y]").astype(np.int64) + 1970
+    monat = datum.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    tag = (datum - datum.astype("datetime64[M]").astype("datetime64[D]")).astype(np.int64) + 1
+    return jahr, monat * 100 + tag
+
+
+def alter_am(geburt, stichtag):
+    """Vollendete Lebensjahre am Stichtag (beides datetime64[D]-Arrays)."""
+    jahr_g, mmtt_g = _jahr_mmtt(geburt)
+    jahr_s, mmtt_s = _jahr_mmtt(stichtag)
+    return jahr_s - jahr_g - (mmtt_s < mmtt_g)
+
+
+def _als_text(datum):
+    return pd.Series(datum).dt.strftime("%d.%m.%Y").fillna("").to_numpy()
+
+
+def berechne_passagiere(df, heute=None):
+    """Ergebnis-Tabelle: Eingaben plus Alter, Visum gültig bis, Reisedauer und Fehler."""
+    n = len(df)
+    leer = pd.Series([""] * n)
+    fehler = np.full(n, "", dtype=object)
+
+    def spalte(name):
+        return df[name].fillna("").str.strip().reset_index(drop=True) if name in df else leer
+
+    def daten(name, beschriftung):
+        texte = spalte(name)
+        werte, gueltig = parse_daten(texte)
+        ungueltig = ~gueltig & (texte != "").to_numpy()
+        fehler[ungueltig] += f"{beschriftung} ungültig; "
+        return werte, gueltig
+
+    geburt, geburt_ok = daten("geburtsdatum", "Geburtsdatum")
+    reise, reise_ok = daten("reisedatum", "Reisedatum")
+    rueck, rueck_ok = daten("rueckreise", "Rückreise")
+    visum, visum_ok = daten("visum_ab", "Visum ab")
+
+    tage_text = spalte("visum_tage")
+    tage = pd.to_numeric(tage_text, errors="coerce").to_numpy()
+    tage_falsch = (tage_text != "").to_numpy() & ~((tage >= 1) & (tage <= 365))
+    fehler[tage_falsch] += "Gültigkeit in Tagen ungültig; "
+    tage = np.where((tage_text == "").to_numpy(), 30, tage)  # Vorgabe wie im Einzelrechner
+
+    # Alter am Reisedatum, ohne Reisedatum am heutigen Tag
+    stichtag = np.where(reise_ok, reise, np.datetime64(heute or date.today(), "D"))
+    zu_spaet = geburt_ok & (geburt > stichtag)
+    fehler[zu_spaet] += np.where(reise_ok[zu_spaet], "Geburtsdatum nach Reisedatum; ", "Geburtsdatum in der Zukunft; ")
+    alter = np.where(geburt_ok & ~zu_spaet, alter_am(geburt, stichtag), -1)
+    visum_ok &= ~tage_falsch
+    ablauf = np.where(visum_ok, visum + np.nan_to_num(tage, nan=0).astype("timedelta64[D]"), np.datetime64("NaT"))
+    dauer = np.where(reise_ok & rueck_ok, np.abs((rueck - reise).astype(np.int64)), -1)
+
+    ergebnis = df.reset_index(drop=True).copy()
+    ergebnis["Alter"] = pd.Series(alter, dtype="Int64").mask(alter < 0)
+    ergebnis["Visum gültig bis"] = _als_text(ablauf)
+    ergebnis["Reisedauer (Tage)"] = pd.Series(dauer, dtype="Int64").mask(dauer < 0)
+    ergebnis["Fehler"] = pd.Series(fehler).str.rstrip("; ")
+    return ergebnis
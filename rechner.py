@@ -0,0 +1,78 @@
+"""Rechenkern der App, ohne Streamlit.
+
+Alle Funktionen bekommen bereits eingelesene Eingaben und geben Ergebnisse
+zurück. Geocoder (Methode geocode) und Zeitzonen-Resolver (timezone_at, zone)
+werden übergeben, damit sie sich für Tests und Benchmarks ersetzen lassen.
+"""
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+import metriken
+
+CheckinErgebnis = namedtuple("CheckinErgebnis", ["abflug_lokal", "zeitzone", "checkin_de"])
+
+
+class OrtNichtGefunden(LookupError):
+    pass
+
+
+class ZeitzoneUnbekannt(LookupError):
+    pass
+
+
+def parse_abflug(text, jahr=None):
+    """ "2405 1925" -> datetime im angegebenen (oder aktuellen) Jahr; ValueError bei falschem Format."""
+    return datetime.strptime(text.strip(), "%d%m %H%M").replace(year=jahr or datetime.now().year)
+
+
+def zeitzone_fuer(abflugort, geocoder, resolver):
+    """Zeitzonenname für einen Abflugort; OrtNichtGefunden/ZeitzoneUnbekannt, wenn das nicht geht."""
+    with metriken.messen("geocode"):
+        location = geocoder.geocode(abflugort)
+    if not location:
+        raise OrtNichtGefunden(abflugort)
+    tz_name = getattr(location, "zeitzone", None)
+    if not tz_name:
+        with metriken.messen("timezone_at"):
+            tz_name = resolver.timezone_at(location.latitude, location.longitude)
+    if not tz_name:
+        raise ZeitzoneUnbekannt(abflugort)
+    return tz_name
+
+
+def checkin_zeit(abflug_dt, tz_name, stunden, resolver):
+    """Frühester Check-in in deutscher Zeit für eine lokale Abflugzeit in tz_name."""
+    with metriken.messen("localize"):
+        abflug_dt_local = resolver.zone(tz_name).localize(abflug_dt)
+        checkin_dt_local = abflug_dt_local - timedelta(hours=stunden)
+        checkin_de = checkin_dt_local.astimezone(resolver.zone("Europe/Berlin"))
+    return CheckinErgebnis(abflug_dt_local, tz_name, checkin_de)
+
+
+def berechne_checkin(abflugort, abflug_dt, stunden, geocoder, resolver):
+    return checkin_zeit(abflug_dt, zeitzone_fuer(abflugort, geocoder, resolver), stunden, resolver)
+
+
+def parse_geburtsdatum(text, heute=None):
+    """Alter in Jahren als Text, "-" bei ungültiger Eingabe."""
+    if not text or len(text.strip()) != 8 or not text.strip().isdigit():
+        return "-"
+    try:
+        geb = datetime.strptime(text.strip(), "%d%m%Y")
+    except ValueError:
+        return "-"
+    heute = heute or date.today()
+    alter = heute.year - geb.year - ((heute.month, heute.day) < (geb.month, geb.day))
+    return str(alter)
+
+
+def visum_ablauf(start_text, tage):
+    """Ablaufdatum eines Visums ab Ausstellungsdatum (TTMMJJJJ); ValueError bei falschem Format."""
+    return datetime.strptime(start_text, "%d%m%Y").date() + timedelta(days=tage)
+
+
+def datumsdifferenz(text1, text2):
+    """Abstand zweier Daten (TTMMJJJJ) in Tagen; ValueError bei falschem Format."""
+    d1 = datetime.strptime(text1.strip(), "%d%m%Y").date()
+    d2 = datetime.strptime(text2.strip(), "%d%m%Y").date()
+    return abs((d2 - d1).days)
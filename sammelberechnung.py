@@ -0,0 +1,122 @@
+"""Check-in-Berechnung für ganze Buchungslisten (CSV/XLSX).
+
+Jeder Abflugort wird nur einmal aufgelöst; die Orte laufen parallel über einen
+Thread-Pool (Nominatim-Fallbacks bleiben durch den Geocoder auf eine Anfrage
+pro Sekunde begrenzt). Datum und Zeitzonen werden spaltenweise mit pandas
+gerechnet. Die Ergebnisse kommen blockweise, damit die Oberfläche sie schon
+anzeigen kann, bevor die ganze Liste fertig ist.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from gazetteer import falte
+from rechner import zeitzone_fuer
+
+SPALTEN = {
+    "airline": ["airline", "airline code", "airline kurzel", "airline kuerzel", "code", "iata"],
+    "abflugort": ["abflugort", "ort", "abflug ort", "departure", "place"],
+    "abflug": ["abflug", "datum", "abflugdatum", "ttmm hhmm", "date"],
+    "stunden": ["stunden", "frist", "check in frist"],
+}
+
+def lese_buchungen(datei, dateiname=None):
+    """Liest eine Buchungsliste und benennt die Spalten einheitlich (airline, abflugort, abflug[, stunden])."""
+    dateiname = (dateiname or getattr(datei, "name", "") or "").lower()
+    if dateiname.endswith((".xlsx", ".xls")):
+        df = pd.read_excel(datei, dtype=str, header=None)
+    else:
+        df = pd.read_csv(datei, dtype=str, sep=None, engine="python", header=None)
+    if df.empty:
+        raise ValueError("Die Liste ist leer.")
+    erste = [falte(str(x)) if pd.notna(x) else "" for x in df.iloc[0]]
+    bekannt = {name for namen in SPALTEN.values() for name in namen}
+    # Überschrift nur, wenn eine Spalte erkannt wird; sonst ist die erste Zeile eine Buchung
+    if any(k in bekannt for k in erste):
+        df = df.iloc[1:].set_axis([str(x) for x in df.iloc[0]], axis=1)
+    umbenennung = {}
+    for spalte in df.columns:
+        key = falte(str(spalte))
+        for ziel, namen in SPALTEN.items():
+            if key in namen and ziel not in umbenennung.values():
+                umbenennung[spalte] = ziel
+    df = df.rename(columns=umbenennung)
+    # ohne erkennbare Überschriften: die ersten drei Spalten in der Reihenfolge der Eingabemaske
+    if not {"airline", "abflugort", "abflug"} <= set(df.columns):
+        if len(df.columns) < 3:
+            raise ValueError("Die Liste braucht die Spalten Airline, Abflugort und Abflug (TTMM HHMM).")
+        df = df.rename(columns=dict(zip(df.columns[:3], ["airline", "abflugort", "abflug"])))
+    for spalte in ("airline", "abflugort", "abflug"):
+        df[spalte] = df[spalte].fillna("").str.strip()
+    df["airline"] = df["airline"].str.upper()
+    return df.reset_index(drop=True)
+
+
+def _zeitzone(ort, geocoder, resolver):
+    try:
+        return zeitzone_fuer(ort, geocoder, resolver)
+    except Exception:
+        return None
+
+
+def berechne_block(df, zonen, fristen, jahr=None):
+    """Rechnet einen Block Buchungen; zonen bildet Abflugort -> Zeitzonenname (oder None) ab."""
+    jahr = jahr or datetime.now().year
+    abflug = pd.to_datetime(str(jahr) + df["abflug"], format="%Y%d%m %H%M", errors="coerce")
+    stunden = df["airline"].map(lambda c: fristen.get(c, {}).get("stunden"))
+    if "stunden" in df:
+        stunden = pd.to_numeric(df["stunden"], errors="coerce").fillna(stunden)
+    tz = df["abflugort"].map(zonen)
+
+    lokal = pd.Series("", index=df.index, dtype=object)
+    checkin = pd.Series("", index=df.index, dtype=object)
+    gueltig = abflug.notna() & tz.notna() & stunden.notna()
+    for tz_name, idx in df.index[gueltig].groupby(tz[gueltig]).items():
+        # wie pytz.localize(is_dst=False): mehrdeutige Zeiten gelten als Normalzeit, Zeiten in der
+        # Umstellungslücke werden mit Normalzeit-Offset gelesen (02:30 -> 03:30 Sommerzeit)
+        abflug_lokal = abflug[idx].dt.tz_localize(
+            tz_name, ambiguous=np.zeros(len(idx), dtype=bool), nonexistent=pd.Timedelta("1h")
+        )
+        checkin_de = (abflug_lokal - pd.to_timedelta(stunden[idx].astype(float), unit="h")).dt.tz_convert(
+            "Europe/Berlin"
+        )
+        lokal[idx] = abflug_lokal.dt.strftime("%d.%m.%Y %H:%M")
+        checkin[idx] = checkin_de.dt.strftime("%d.%m.%Y %H:%M")
+
+    hinweis = df["airline"].map(lambda c: fristen.get(c, {}).get("hinweis", "")).fillna("")
+    hinweis = hinweis.mask(stunden.isna(), "Airline nicht erkannt – Frist fehlt")
+    hinweis = hinweis.mask(tz.isna(), "Ort/Zeitzone nicht gefunden")
+    hinweis = hinweis.mask(abflug.isna(), "Ungültiges Datum (TTMM HHMM)")
+    return pd.DataFrame({
+        "Airline": df["airline"],
+        "Abflugort": df["abflugort"],
+        "Abflug (lokal)": lokal,
+        "Zeitzone": tz.fillna(""),
+        "Check-in ab (DE)": checkin,
+        "Hinweis": hinweis,
+    })
+
+
+def berechne_liste(df, fristen, geocoder, resolver, blockgroesse=250, max_threads=8):
+    """Generator über Ergebnisblöcke in Reihenfolge der Liste.
+
+    Alle eindeutigen Orte werden sofort parallel angestoßen; ein Block wird
+    ausgegeben, sobald seine eigenen Orte aufgelöst sind.
+    """
+    # ohne with: bricht die Oberfläche ab (Rerun, Session-Ende), soll close() nicht auf
+    # alle noch wartenden Nominatim-Anfragen warten
+    pool = ThreadPoolExecutor(max_workers=max_threads)
+    try:
+        auftraege = {ort: pool.submit(_zeitzone, ort, geocoder, resolver)
+                     for ort in df["abflugort"].unique() if ort}
+        zonen = {}
+        for start in range(0, len(df), blockgroesse):
+            block = df.iloc[start:start + blockgroesse]
+            for ort in block["abflugort"].unique():
+                if ort and ort not in zonen:
+                    zonen[ort] = auftraege[ort].result()
+            yield berechne_block(block, zonen, fristen)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,123 @@
+"""Abflugort schon im Hintergrund auflösen, bevor der Button gedrückt wird.
+
+Sobald das Feld "Abflugort" einen neuen Wert hat, wird nach einer kurzen Pause
+(Entprellung) Geocoding plus Zeitzonensuche in einem Thread-Pool gestartet, den
+alle Sessions teilen. Beim Klick liegt die Zeitzone dann meist schon vor.
+Fragen mehrere Sessions gleichzeitig denselben Ort an, läuft nur eine Suche.
+Ändert sich die Eingabe, wird der alte Auftrag verworfen; eine noch nicht
+gestartete Suche, die sonst niemand braucht, wird abgebrochen.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from gazetteer import falte
+from rechner import zeitzone_fuer
+import metriken
+
+
+class Auftrag:
+    """Vorab-Suche einer Session für einen Text."""
+
+    def __init__(self, vorabsuche, text):
+        self.text = text
+        self._vorabsuche = vorabsuche
+        self._lock = threading.Lock()
+        self._future = None
+        self._verworfen = False
+        self._timer = threading.Timer(vorabsuche.verzoegerung, self._starte)
+        self._timer.daemon = True
+
+    def _starte(self):
+        with self._lock:
+            if self._future is None and not self._verworfen:
+                self._future = self._vorabsuche._beitreten(self.text)
+            return self._future
+
+    def fertig(self):
+        return self._future is not None and self._future.done()
+
+    def _gescheitert(self):
+        # Netz- oder Nominatim-Fehler sollen beim nächsten Versuch neu gefragt werden,
+        # "Ort nicht gefunden" dagegen bleibt gültig
+        if not self.fertig() or self._future.cancelled():
+            return False
+        fehler = self._future.exception()
+        return fehler is not None and not isinstance(fehler, LookupError)
+
+    def ergebnis(self, timeout=None):
+        """Zeitzonenname; wartet, falls die Suche noch läuft, und startet sie sofort, falls sie noch wartet.
+
+        Wirft wie rechner.zeitzone_fuer OrtNichtGefunden/ZeitzoneUnbekannt.
+        """
+        self._timer.cancel()
+        future = self._starte()
+        if future is None:
+            raise RuntimeError("Auftrag wurde verworfen")
+        return future.result(timeout)
+
+    def verwerfen(self):
+        self._timer.cancel()
+        with self._lock:
+            if self._verworfen:
+                return
+            self._verworfen = True
+            future = self._future
+        if future is not None:
+            self._vorabsuche._loslassen(self.text, future)
+        metriken.zaehle("vorabsuche_verworfen")
+
+
+class Vorabsuche:
+    def __init__(self, geocoder, resolver, max_threads=4, verzoegerung=0.3):
+        self.geocoder = geocoder
+        self.resolver = resolver
+        self.verzoegerung = verzoegerung
+        self.gestartet = 0
+        self.zusammengelegt = 0
+        self._pool = ThreadPoolExecutor(max_threads, thread_name_prefix="vorabsuche")
+        self._laufend = {}  # Suchschlüssel -> [Future, Anzahl interessierter Aufträge]
+        self._lock = threading.RLock()  # cancel() ruft _entfernen im selben Thread auf
+
+    def vormerken(self, text, alt=None):
+        """Neuer Auftrag für text; alt (der vorige Auftrag der Session) wird verworfen."""
+        if alt is not None:
+            if alt.text == text and not alt._gescheitert():
+                return alt
+            alt.verwerfen()
+        auftrag = Auftrag(self, text)
+        if text:
+            auftrag._timer.start()
+        return auftrag
+
+    def _beitreten(self, text):
+        key = falte(text)
+        with self._lock:
+            eintrag = self._laufend.get(key)
+            if eintrag is None:
+                future = self._pool.submit(zeitzone_fuer, text, self.geocoder, self.resolver)
+                eintrag = self._laufend[key] = [future, 0]
+                self.gestartet += 1
+            else:
+                self.zusammengelegt += 1
+            eintrag[1] += 1
+        # außerhalb des Locks: ist die Suche schon fertig, läuft der Callback sofort in diesem Thread
+        eintrag[0].add_done_callback(lambda f: self._entfernen(key, f))
+        return eintrag[0]
+
+    def _entfernen(self, key, future):
+        with self._lock:
+            if self._laufend.get(key, [None])[0] is future:
+                del self._laufend[key]
+
+    def _loslassen(self, text, future):
+        key = falte(text)
+        with self._lock:
+            eintrag = self._laufend.get(key)
+            if eintrag is None or eintrag[0] is not future:
+                return
+            eintrag[1] -= 1
+            if eintrag[1] == 0 and future.cancel():
+                metriken.zaehle("vorabsuche_abgebrochen")
+
+    def statistik(self):
+        return {"gestartet": self.gestartet, "zusammengelegt": self.zusammengelegt, "laufend": len(self._laufend)}
@@ -0,0 +1,79 @@
+"""Prozessweiter Zeitzonen-Resolver mit Cache.
+
+TimezoneFinder lädt beim Anlegen seine Polygondaten; das soll pro Prozess nur
+einmal passieren, nicht bei jeder Berechnung und nicht pro Streamlit-Session.
+Koordinaten werden auf ein Raster gerundet (3 Nachkommastellen, ca. 100 m) und
+das Ergebnis in einem begrenzten LRU-Cache gehalten.
+"""
+import threading
+from collections import OrderedDict
+
+import pytz
+
+import metriken
+
+
+class ZeitzonenResolver:
+    def __init__(self, max_eintraege=50_000, raster=3):
+        self.max_eintraege = max_eintraege
+        self.raster = raster
+        self.treffer = 0
+        self.fehlschlaege = 0
+        self._cache = OrderedDict()
+        self._zonen = {}
+        self._tf = None
+        self._lock = threading.Lock()
+
+    def _finder(self):
+        if self._tf is None:
+            from timezonefinder import TimezoneFinder
+            with metriken.messen("timezonefinder_laden"):
+                self._tf = TimezoneFinder()
+        return self._tf
+
+    def timezone_at(self, lat, lng):
+        """Name der Zeitzone (z. B. "Europe/Berlin") oder None."""
+        key = (round(lat, self.raster), round(lng, self.raster))
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.treffer += 1
+                return self._cache[key]
+            self.fehlschlaege += 1
+            # TimezoneFinder ist nicht threadsicher, daher auch die Suche unter dem Lock
+            tz_name = self._finder().timezone_at(lng=lng, lat=lat)
+            self._cache[key] = tz_name
+            if len(self._cache) > self.max_eintraege:
+                self._cache.popitem(last=False)
+            return tz_name
+
+    def zone(self, tz_name):
+        """pytz-Zeitzonenobjekt, einmal pro Name erzeugt."""
+        tz = self._zonen.get(tz_name)
+        if tz is None:
+            tz = self._zonen[tz_name] = pytz.timezone(tz_name)
+        return tz
+
+    def statistik(self):
+        with self._lock:
+            return {
+                "treffer": self.treffer,
+                "fehlschlaege": self.fehlschlaege,
+                "eintraege": len(self._cache),
+                "zonen": len(self._zonen),
+            }
+
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def resolver():
+    """Der gemeinsame Resolver des Prozesses (für alle Sessions und Threads)."""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = ZeitzonenResolver()
+                metriken.cache("zeitzonen", lambda: (_resolver.treffer, _resolver.fehlschlaege))
+    return _resolver